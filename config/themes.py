@@ -2,6 +2,13 @@
 Theme configurations and color presets for the mathematical series visualization application.
 """
 
+import math
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Tuple
+
+import numpy as np
+
 # Color themes for the application
 THEMES = {
     'dark': {
@@ -74,13 +81,16 @@ ANIMATION_CONFIG = {
     'epicycle_radius_scale': 0.8  # scale factor for epicycle display
 }
 
+# Full turn in radians, shared by the time ranges below
+_TAU = math.tau
+
 # Mathematical constants and defaults
 MATH_CONFIG = {
     'default_terms': 10,
     'max_terms': 50,
     'min_terms': 1,
     'precision': 1000,  # number of points for curve calculation
-    'time_range': 4 * 3.14159,  # 2π for one complete cycle
+    'time_range': 2 * _TAU,  # 4π for two complete cycles
 }
 
 # Canvas dimensions and layout
@@ -93,28 +103,105 @@ CANVAS_CONFIG = {
 
 # Predefined color palettes for epicycles
 EPICYCLE_COLOR_PALETTES = {
-    'vibrant': [
+    'vibrant': (
         '#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FECA57', 
         '#FF9FF3', '#54A0FF', '#5F27CD', '#00D2D3', '#FF9F43',
         '#10AC84', '#EE5A24', '#0ABDE3', '#C44569', '#F8B500',
         '#6C5CE7', '#A29BFE', '#FD79A8', '#00B894', '#FDCB6E'
-    ],
-    'neon': [
+    ),
+    'neon': (
         '#FF0080', '#00FF80', '#8000FF', '#FF8000', '#0080FF',
         '#FF0040', '#40FF00', '#4000FF', '#FF4000', '#0040FF',
         '#FF00C0', '#C0FF00', '#C000FF', '#FFC000', '#00C0FF'
-    ],
-    'pastel': [
+    ),
+    'pastel': (
         '#FFB3BA', '#FFDFBA', '#FFFFBA', '#BAFFC9', '#BAE1FF',
         '#FFBAFF', '#FFBABA', '#BAFFFF', '#C9BAFF', '#FFCBA4'
-    ],
-    'ocean': [
+    ),
+    'ocean': (
         '#00D4FF', '#0080FF', '#4000FF', '#8000FF', '#C000FF',
         '#FF0080', '#FF0040', '#FF4000', '#FF8000', '#FFC000'
-    ]
+    )
+}
+
+# Fallback palette for unknown palette names
+_DEFAULT_PALETTE = EPICYCLE_COLOR_PALETTES['vibrant']
+
+# Gradient colors for curve drawing
+_CURVE_GRADIENT = (
+    '#FF6B6B', '#FF8A5B', '#FFA94D', '#FFD93D', 
+    '#6BCF7F', '#4ECDC4', '#45B7D1', '#5A67D8',
+    '#9F7AEA', '#ED8796', '#F093FB', '#F5576C'
+)
+
+def _hex_to_rgb(color: str) -> tuple:
+    """Convert a '#rrggbb' string into an (r, g, b) tuple of floats in [0, 1]."""
+    return (int(color[1:3], 16) / 255, int(color[3:5], 16) / 255, int(color[5:7], 16) / 255)
+
+# Theme colors pre-parsed once so matplotlib never has to decode hex strings per draw
+THEMES_RGB = {
+    name: {key: _hex_to_rgb(value) for key, value in palette.items()}
+    for name, palette in THEMES.items()
+}
+
+# Read-only theme color views, including derived colors, built once at import
+_THEME_COLORS_CACHE = {
+    name: MappingProxyType({**palette, 'plot_background': palette['canvas_bg'], 'axes': palette['text']})
+    for name, palette in THEMES.items()
 }
 
-def get_theme_colors(theme_name: str = 'dark') -> dict:
+# Read-only views of the configuration dictionaries
+_ANIMATION_CONFIG_VIEW = MappingProxyType(ANIMATION_CONFIG)
+_MATH_CONFIG_VIEW = MappingProxyType(MATH_CONFIG)
+_CANVAS_CONFIG_VIEW = MappingProxyType(CANVAS_CONFIG)
+
+# ASCII code -> hex digit value lookup table
+_HEX_NIBBLE = np.zeros(256, dtype=np.uint8)
+_HEX_NIBBLE[ord('0'):ord('9') + 1] = np.arange(10)
+_HEX_NIBBLE[ord('a'):ord('f') + 1] = np.arange(10, 16)
+_HEX_NIBBLE[ord('A'):ord('F') + 1] = np.arange(10, 16)
+
+def hex_array_to_rgb(colors) -> np.ndarray:
+    """
+    Decode a sequence of '#rrggbb' strings in one vectorized pass.
+    
+    Args:
+        colors: Iterable of hex color strings
+        
+    Returns:
+        (n_colors, 3) uint8 array of RGB values
+    """
+    raw = np.frombuffer(''.join(colors).encode('ascii'), dtype=np.uint8).reshape(-1, 7)
+    nibbles = _HEX_NIBBLE[raw[:, 1:]]
+    return (nibbles[:, 0::2] << 4) | nibbles[:, 1::2]
+
+# Epicycle palettes pre-decoded to (n_colors, 3) uint8 RGB arrays
+EPICYCLE_PALETTES_U8 = {
+    name: hex_array_to_rgb(palette) for name, palette in EPICYCLE_COLOR_PALETTES.items()
+}
+_DEFAULT_PALETTE_U8 = EPICYCLE_PALETTES_U8['vibrant']
+
+# Freeze the static tables now that every derived view has been built
+THEMES = MappingProxyType({name: MappingProxyType(palette) for name, palette in THEMES.items()})
+THEMES_RGB = MappingProxyType({name: MappingProxyType(palette) for name, palette in THEMES_RGB.items()})
+_THEME_COLORS_CACHE = MappingProxyType(_THEME_COLORS_CACHE)
+EPICYCLE_COLOR_PALETTES = MappingProxyType(EPICYCLE_COLOR_PALETTES)
+for _palette in EPICYCLE_PALETTES_U8.values():
+    _palette.setflags(write=False)
+del _palette
+EPICYCLE_PALETTES_U8 = MappingProxyType(EPICYCLE_PALETTES_U8)
+
+_AVAILABLE_THEMES = tuple(THEMES)
+
+def _lookup_theme(table: Mapping, theme_name: str):
+    """Look up a per-theme table entry, case-folding the name only when the exact key misses."""
+    entry = table.get(theme_name)
+    if entry is None:
+        folded = theme_name.lower() if isinstance(theme_name, str) else 'dark'
+        entry = table.get(folded, table['dark'])
+    return entry
+
+def get_theme_colors(theme_name: str = 'dark') -> Mapping[str, str]:
     """
     Get color configuration for a specific theme.
     
@@ -122,45 +209,69 @@ def get_theme_colors(theme_name: str = 'dark') -> dict:
         theme_name: Name of the theme ('dark', 'light', 'ocean', 'sunset')
         
     Returns:
-        Dictionary containing color values for the theme
+        Read-only mapping containing color values for the theme
+        (use dict(...) for a mutable copy)
     """
-    theme_name = theme_name.lower()
-    
-    if theme_name not in THEMES:
-        theme_name = 'dark'  # Default fallback
-    
-    colors = THEMES[theme_name].copy()
-    
-    # Add derived colors for consistency
-    colors['plot_background'] = colors['canvas_bg']
-    colors['axes'] = colors['text']
+    return _lookup_theme(_THEME_COLORS_CACHE, theme_name)
+
+def get_theme_rgb(theme_name: str = 'dark') -> Mapping[str, tuple]:
+    """
+    Get pre-parsed RGB color tuples for a specific theme.
     
-    return colors
+    Args:
+        theme_name: Name of the theme ('dark', 'light', 'ocean', 'sunset')
+        
+    Returns:
+        Read-only mapping of color keys to (r, g, b) float tuples
+    """
+    return _lookup_theme(THEMES_RGB, theme_name)
 
-def get_animation_config() -> dict:
-    """Get animation configuration settings."""
-    return ANIMATION_CONFIG.copy()
+def get_animation_config() -> Mapping:
+    """Get read-only animation configuration settings."""
+    return _ANIMATION_CONFIG_VIEW
 
-def get_math_config() -> dict:
-    """Get mathematical configuration settings."""
-    return MATH_CONFIG.copy()
+def get_math_config() -> Mapping:
+    """Get read-only mathematical configuration settings."""
+    return _MATH_CONFIG_VIEW
 
-def get_canvas_config() -> dict:
-    """Get canvas configuration settings."""
-    return CANVAS_CONFIG.copy()
+def get_canvas_config() -> Mapping:
+    """Get read-only canvas configuration settings."""
+    return _CANVAS_CONFIG_VIEW
 
-def get_available_themes() -> list:
-    """Get list of available theme names."""
-    return list(THEMES.keys())
+def get_available_themes() -> Tuple[str, ...]:
+    """Get the available theme names (wrap in list(...) if a mutable copy is needed)."""
+    return _AVAILABLE_THEMES
 
-def get_epicycle_colors(palette_name: str = 'vibrant') -> list:
+def get_epicycle_colors(palette_name: str = 'vibrant') -> tuple:
     """Get color palette for epicycles"""
-    return EPICYCLE_COLOR_PALETTES.get(palette_name, EPICYCLE_COLOR_PALETTES['vibrant'])
+    return EPICYCLE_COLOR_PALETTES.get(palette_name, _DEFAULT_PALETTE)
+
+def get_epicycle_colors_rgb(palette_name: str = 'vibrant') -> np.ndarray:
+    """Get color palette for epicycles as an (n_colors, 3) uint8 RGB array"""
+    return EPICYCLE_PALETTES_U8.get(palette_name, _DEFAULT_PALETTE_U8)
 
-def get_curve_gradient_colors() -> list:
+def get_curve_gradient_colors() -> tuple:
     """Get gradient colors for curve drawing"""
-    return [
-        '#FF6B6B', '#FF8A5B', '#FFA94D', '#FFD93D', 
-        '#6BCF7F', '#4ECDC4', '#45B7D1', '#5A67D8',
-        '#9F7AEA', '#ED8796', '#F093FB', '#F5576C'
-    ]
+    return _CURVE_GRADIENT
+
+# Gradient stops decoded once to (n_stops, 3) floats in [0, 1]
+_CURVE_GRADIENT_STOPS = hex_array_to_rgb(_CURVE_GRADIENT).astype(np.float32) / 255
+
+@lru_cache(maxsize=None)
+def get_curve_gradient_array(n: int = 1000) -> np.ndarray:
+    """
+    Get the curve gradient interpolated to n evenly spaced colors.
+    
+    Args:
+        n: Number of colors to sample along the gradient
+        
+    Returns:
+        Read-only (n, 3) float32 array of RGB values in [0, 1]
+    """
+    stops = np.arange(len(_CURVE_GRADIENT_STOPS))
+    positions = np.linspace(0, stops[-1], n)
+    colors = np.empty((n, 3), dtype=np.float32)
+    for channel in range(3):
+        colors[:, channel] = np.interp(positions, stops, _CURVE_GRADIENT_STOPS[:, channel])
+    colors.setflags(write=False)
+    return colors
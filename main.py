@@ -7,25 +7,27 @@ mathematical series using animated epicycles and graphs.
 """
 
 import sys
-import os
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtCore import Qt
 
-# Add the current directory to the path to enable imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
-from ui.enhanced_main_window import EnhancedMainWindow as MainWindow
+APP_NAME = "Mathematical Series Visualizer"
+APP_VERSION = "1.0.0"
 
 
 def main():
     """Initialize and run the application."""
-    # Enable high DPI display support
-    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
-    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+    # Enable high DPI display support (these attributes no longer exist on Qt 6)
+    if hasattr(Qt, 'AA_EnableHighDpiScaling'):
+        QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
+    if hasattr(Qt, 'AA_UseHighDpiPixmaps'):
+        QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
     
     app = QApplication(sys.argv)
-    app.setApplicationName("Mathematical Series Visualizer")
-    app.setApplicationVersion("1.0.0")
+    app.setApplicationName(APP_NAME)
+    app.setApplicationVersion(APP_VERSION)
+    
+    # Import the window (and with it matplotlib/numpy) only once Qt is up
+    from ui.enhanced_main_window import EnhancedMainWindow as MainWindow
     
     # Create and show the main window
     window = MainWindow()
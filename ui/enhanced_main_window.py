@@ -4,26 +4,97 @@ Enhanced main window with formula display, parameter controls, and individual tr
 
 import sys
 import os
+import re
+import itertools
+import queue
+from functools import lru_cache
 import numpy as np
 from typing import List, Dict, Any, Optional
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                              QComboBox, QPushButton, QLabel, QSlider, QSpinBox,
                              QGroupBox, QGridLayout, QTextEdit, QSplitter, 
-                             QFrame, QDoubleSpinBox, QCheckBox, QScrollArea)
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal
+                             QFrame, QDoubleSpinBox, QCheckBox, QScrollArea,
+                             QApplication, QDialog, QFileDialog, QLineEdit,
+                             QMessageBox, QProgressDialog)
+from PyQt5.QtCore import Qt, QTimer, QThread, pyqtSignal
 from PyQt5.QtGui import QFont, QPalette, QColor
 
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 from matplotlib.animation import FuncAnimation
-import matplotlib.patches as patches
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba_array
+from PIL import Image
+
+# Pillow 9.1 moved the quantize/dither constants into enums; older releases only have the flat names
+try:
+    QUANTIZE_FASTOCTREE, DITHER_NONE = Image.Quantize.FASTOCTREE, Image.Dither.NONE
+except AttributeError:
+    QUANTIZE_FASTOCTREE, DITHER_NONE = Image.FASTOCTREE, Image.NONE
+
+try:
+    import imageio.v2 as imageio
+    HAS_IMAGEIO = True
+except ImportError:
+    HAS_IMAGEIO = False
+
+try:
+    import sympy
+    from sympy.calculus.util import continuous_domain
+    from sympy.parsing.sympy_parser import (parse_expr, standard_transformations,
+                                            convert_xor, TokenError)
+    HAS_SYMPY = True
+except ImportError:
+    HAS_SYMPY = False
 
 # Import our custom utilities
 from utils.concept_loader import (load_visualization_concepts, get_dropdown_options, 
                                  parse_dropdown_selection, get_all_concepts_flat)
-from utils.math_utils import generate_curve_from_concept, ConceptMath
-from config.themes import get_theme_colors, get_epicycle_colors
+from utils.math_utils import generate_curve_from_concept, epicycle_arrays, sine_series_arrays
+from utils.epicycle_kernels import compute_chain
+from config.themes import get_theme_rgb, get_epicycle_colors_rgb
+
+
+# Upper bound on epicycles per concept (matches the terms spinbox range)
+MAX_EPICYCLES = 25
+
+# Colors cycled along the combined curve's gradient
+COMBINED_GRADIENT_RGBA = to_rgba_array(['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FECA57'])
+
+# Unit circle polyline that every epicycle ring is scaled and shifted from
+_RING_ANGLES = np.linspace(0, 2 * np.pi, 65)
+UNIT_CIRCLE = np.column_stack((np.cos(_RING_ANGLES), np.sin(_RING_ANGLES)))
+
+# Number of samples kept in each trace ring buffer
+TRACE_LENGTH = 1000
+
+# Directory that image snapshots are saved to
+_ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'assets')
+
+# GIF export: evenly spaced frames over one animation cycle, and playback rate
+GIF_FRAMES = 120
+GIF_FPS = 20
+
+
+def _ring_write(buffer: np.ndarray, count: int, value):
+    """
+    Store sample number `count` in a mirrored ring buffer.
+    
+    The buffer holds two copies of a TRACE_LENGTH ring along its last axis,
+    so the latest samples are always one contiguous slice.
+    """
+    slot = count % TRACE_LENGTH
+    buffer[..., slot] = value
+    buffer[..., slot + TRACE_LENGTH] = value
+
+
+def _ring_view(buffer: np.ndarray, count: int) -> np.ndarray:
+    """Zero-copy view of a mirrored ring buffer's samples in write order"""
+    if count <= TRACE_LENGTH:
+        return buffer[..., :count]
+    start = count % TRACE_LENGTH
+    return buffer[..., start:start + TRACE_LENGTH]
 
 
 class EnhancedAnimationCanvas(FigureCanvas):
@@ -46,21 +117,26 @@ class EnhancedAnimationCanvas(FigureCanvas):
         self.time_step = 0.05
         self.max_time = 4 * np.pi
         
-        # Data storage
-        self.epicycles = []
-        self.curve_x = []
-        self.curve_y = []
-        self.traced_points = []
-        self.individual_traces = []  # Store traces for each epicycle
-        self.current_concept = None
-        
         # Adjustable parameters
         self.amplitude_scale = 1.0
         self.frequency_scale = 1.0
         self.phase_offset = 0.0
         self.show_individual_traces = True
+        self.theme_name = None
+        self._tight_bbox = None  # Cached savefig bbox; reset whenever the layout may change
+        
+        # Data storage
+        self.epicycles = []  # Epicycle records of a built-in concept; animation uses the arrays below
+        self._R0, self._F0, self._P0 = epicycle_arrays(self.epicycles)  # Unscaled epicycle arrays
+        self.apply_scales()
+        self.curve_x = []
+        self.curve_y = []
+        self._curve_y_abs_max = 0.0
+        self.current_concept = None
+        self.reset_traces()
         
         self.setup_plots()
+        self.create_artists()
     
     def setup_plots(self):
         """Initialize the three plot panels"""
@@ -91,14 +167,149 @@ class EnhancedAnimationCanvas(FigureCanvas):
         self.apply_theme('dark')
         self.fig.tight_layout()
     
+    def create_artists(self):
+        """Create the persistent artists that animate_frame updates in place"""
+        self._epicycle_colors = get_epicycle_colors_rgb('vibrant') / 255.0
+        n_colors = len(self._epicycle_colors)
+        
+        # Rings, connecting chain and radius lines for all epicycles, one collection each
+        palette = self._epicycle_colors[np.arange(MAX_EPICYCLES) % n_colors]
+        self._chain_lc = LineCollection([], colors=palette, linewidths=2.5, alpha=0.6)
+        self._ring_lc = LineCollection([], colors=palette, linewidths=2.5, alpha=0.8)
+        self._radius_lc = LineCollection([], colors=palette, linewidths=3, alpha=0.9, zorder=5)
+        self.ax_epicycles.add_collection(self._chain_lc)
+        self.ax_epicycles.add_collection(self._ring_lc)
+        self.ax_epicycles.add_collection(self._radius_lc)
+        
+        # Individual traces share one time axis, so they form one collection too
+        self._individual_lc = LineCollection([], colors=palette, linewidths=2, alpha=0.7, zorder=2)
+        self.ax_individual.add_collection(self._individual_lc)
+        
+        # Chain markers and the individual traces' current positions, one scatter each
+        self._center_sc = self.ax_epicycles.scatter(
+            [], [], s=6**2, alpha=0.9, edgecolors='white', linewidths=1, zorder=6)
+        self._point_sc = self.ax_epicycles.scatter(
+            [], [], s=5**2, alpha=0.8, edgecolors='face', linewidths=1, zorder=7)
+        self._individual_sc = self.ax_individual.scatter(
+            [], [], s=5**2, edgecolors='face', linewidths=1, zorder=5)
+        for scatter in (self._center_sc, self._point_sc, self._individual_sc):
+            scatter.set_facecolor(palette)
+        
+        # Final point with special highlighting
+        self._final_markers = [
+            self.ax_epicycles.plot([], [], 'o', color='white', markersize=12, alpha=0.9, zorder=8)[0],
+            self.ax_epicycles.plot([], [], 'o', color='#FF0040', markersize=10, alpha=1.0, zorder=9)[0],
+            self.ax_epicycles.plot([], [], 'o', color='#FFFFFF', markersize=4, alpha=1.0, zorder=10)[0],
+        ]
+        
+        # Gradient segments and current position of the combined curve
+        self._combined_lc = LineCollection([], linewidths=2.5, zorder=3)
+        self.ax_combined.add_collection(self._combined_lc)
+        self._combined_marker = self.ax_combined.plot(
+            [], [], 'o', color='#FF0040', markersize=8, alpha=1.0, zorder=10)[0]
+        
+        self._artists = (self._chain_lc, self._ring_lc, self._radius_lc,
+                         self._center_sc, self._point_sc,
+                         self._individual_lc, self._individual_sc,
+                         *self._final_markers, self._combined_lc, self._combined_marker)
+        self.clear_artists()
+    
+    def precompute_trajectory(self):
+        """Evaluate the unit-amplitude epicycle chain once for every animation frame"""
+        self._ts = np.arange(0, self.max_time, self.time_step)
+        self._positions_unit = compute_chain(self._R0, self._F, self._P, self._ts)
+        # Individual contributions are the y components of each epicycle's arm
+        self._arms_y_unit = np.diff(self._positions_unit[:, :, 1], axis=1)
+    
+    @property
+    def n_frames(self) -> int:
+        """Number of frames in one full animation cycle"""
+        return len(self._ts)
+    
+    def iter_frame_images(self, n_frames: Optional[int] = None):
+        """
+        Render one full animation cycle from t = 0, yielding each frame as an RGB array.
+        
+        Args:
+            n_frames: Number of evenly spaced frames to render (default: every frame)
+        """
+        ts = self._ts
+        if n_frames is not None:
+            ts = ts[np.linspace(0, len(ts), n_frames, endpoint=False).astype(int)]
+        
+        self.clear_traces()
+        
+        # Draw the static figure once, then restore it and draw only the artists per frame
+        artists = sorted(self._artists, key=lambda artist: artist.get_zorder())
+        was_animated = [artist.get_animated() for artist in artists]
+        for artist in artists:
+            artist.set_animated(True)
+        try:
+            self.draw()
+            background = self.copy_from_bbox(self.fig.bbox)
+            renderer = self.get_renderer()
+            for t in ts:
+                self.current_time = t
+                self.update_frame()
+                self.restore_region(background)
+                for artist in artists:
+                    artist.draw(renderer)
+                # View of the Agg buffer; valid until the next frame
+                yield np.asarray(self.buffer_rgba())[:, :, :3]
+        finally:
+            for artist, animated in zip(artists, was_animated):
+                artist.set_animated(animated)
+    
+    def reset_traces(self):
+        """Allocate empty ring buffers for the individual and combined traces"""
+        # Individual traces share one time axis: row i holds epicycle i's values
+        self._trace_t = np.empty(2 * TRACE_LENGTH)
+        self._trace_v = np.empty((self._R0.size, 2 * TRACE_LENGTH))
+        self._trace_count = 0
+        
+        # Combined trace (final point's y over time)
+        self._combined_t = np.empty(2 * TRACE_LENGTH)
+        self._combined_v = np.empty(2 * TRACE_LENGTH)
+        self._combined_count = 0
+    
+    def clear_artists(self):
+        """Hide every animated artist until the next frame updates it"""
+        for artist in self._artists:
+            artist.set_visible(False)
+    
+    def redraw_background(self):
+        """Redraw the static figure and drop stale blitting backgrounds"""
+        # Backgrounds are cached per axes view, so theme/title changes must evict them.
+        # Matplotlib has no public hook for this (a synthetic resize event would also
+        # resume a paused animation), so the private cache is cleared only if present.
+        blit_cache = getattr(self.animation, '_blit_cache', None)
+        if blit_cache is not None:
+            blit_cache.clear()
+        self.draw()
+    
+    def tight_bbox(self):
+        """Tight bounding box for saving the figure, measured once per layout"""
+        if self._tight_bbox is None:
+            self.draw()
+            self._tight_bbox = self.fig.get_tightbbox(self.get_renderer()).padded(
+                plt.rcParams['savefig.pad_inches'])
+        return self._tight_bbox
+    
+    def resizeEvent(self, event):
+        self._tight_bbox = None
+        super().resizeEvent(event)
+    
     def apply_theme(self, theme_name: str = 'dark'):
-        """Apply color theme to all plots"""
-        colors = get_theme_colors(theme_name)
+        """Apply color theme to all plots (no-op if it is already applied)"""
+        if theme_name == self.theme_name:
+            return
+        self.theme_name = theme_name
+        colors = get_theme_rgb(theme_name)
         
         # Set background colors
         self.fig.patch.set_facecolor(colors['background'])
         for ax in [self.ax_epicycles, self.ax_individual, self.ax_combined]:
-            ax.set_facecolor(colors['plot_background'])
+            ax.set_facecolor(colors['canvas_bg'])
             ax.xaxis.label.set_color(colors['text'])
             ax.yaxis.label.set_color(colors['text'])
             ax.title.set_color(colors['text'])
@@ -116,205 +327,297 @@ class EnhancedAnimationCanvas(FigureCanvas):
         self.curve_x, self.curve_y, self.epicycles = generate_curve_from_concept(
             concept, n_terms, 1000
         )
+        self._curve_y_abs_max = float(np.max(np.abs(self.curve_y))) if len(self.curve_y) else 0.0
         
         # Apply parameter adjustments
-        for epicycle in self.epicycles:
-            epicycle['radius'] *= self.amplitude_scale
-            epicycle['frequency'] *= self.frequency_scale
-            epicycle['phase'] += self.phase_offset
+        self._R0, self._F0, self._P0 = epicycle_arrays(self.epicycles)
+        self.apply_scales()
         
         # Initialize individual traces
-        self.individual_traces = [[] for _ in range(len(self.epicycles))]
-        self.traced_points = []
+        self.reset_traces()
         self.current_time = 0
+        self.clear_artists()
+        self.update_limits()
+        
+        # Update plot titles
+        concept_name = concept.get('name', 'Unknown')
+        concept_type = concept.get('type', 'Unknown')
+        self.ax_epicycles.set_title(f'Epicycles: {concept_name}', fontsize=12, fontweight='bold')
+        self.ax_individual.set_title(f'Individual Components: {concept_name}', fontsize=12, fontweight='bold')
+        self.ax_combined.set_title(f'{concept_type}: {concept_name}', fontsize=12, fontweight='bold')
         
-        # Update plot limits
-        if len(self.curve_y) > 0:
-            y_range = max(abs(np.max(self.curve_y)), abs(np.min(self.curve_y))) * self.amplitude_scale
+        self.redraw_background()
+    
+    def apply_scales(self):
+        """Derive the animated epicycle arrays from the unscaled ones and the parameters"""
+        self._F = self._F0 * self.frequency_scale
+        self._P = self._P0 + self.phase_offset
+        self.precompute_trajectory()
+        self.apply_amplitude()
+    
+    def apply_amplitude(self):
+        """Rescale the radii and the cached trajectory; every position is linear in amplitude"""
+        self._R = self._R0 * self.amplitude_scale
+        self._positions_all = self._positions_unit * self.amplitude_scale
+        self._arms_y_all = self._arms_y_unit * self.amplitude_scale
+    
+    def update_limits(self):
+        """Fit the plot limits to the current curve and epicycle sizes"""
+        self._tight_bbox = None  # Tick labels may change width
+        if self._curve_y_abs_max > 0:
+            y_range = self._curve_y_abs_max * self.amplitude_scale
             self.ax_individual.set_ylim(-y_range * 1.2, y_range * 1.2)
             self.ax_combined.set_ylim(-y_range * 1.2, y_range * 1.2)
         
         # Calculate epicycle system range
-        total_radius = sum(ep['radius'] for ep in self.epicycles)
+        total_radius = float(self._R.sum())
         if total_radius > 0:
             margin = total_radius * 1.2
             self.ax_epicycles.set_xlim(-margin, margin)
             self.ax_epicycles.set_ylim(-margin, margin)
-        
-        # Update plot titles
-        concept_name = concept.get('name', 'Unknown')
-        concept_type = concept.get('type', 'Unknown')
-        self.ax_epicycles.set_title(f'Epicycles: {concept_name}', fontsize=12, fontweight='bold')
-        self.ax_individual.set_title(f'Individual Components: {concept_name}', fontsize=12, fontweight='bold')
-        self.ax_combined.set_title(f'{concept_type}: {concept_name}', fontsize=12, fontweight='bold')
-        
-        self.draw()
+    
+    def load_epicycles(self, concept: Dict[str, Any], radii: np.ndarray,
+                       frequencies: np.ndarray, phases: np.ndarray):
+        """Show a precomputed set of epicycle arrays (e.g. from a custom equation)"""
+        self.current_concept = concept
+        self._tight_bbox = None
+        self.epicycles = []
+        self._R0, self._F0, self._P0 = radii, frequencies, phases
+        self.apply_scales()
+        self.clear_traces()
     
     def update_parameters(self, amplitude: float, frequency: float, phase: float):
         """Update mathematical parameters and refresh visualization"""
+        retime = frequency != self.frequency_scale or phase != self.phase_offset
         self.amplitude_scale = amplitude
         self.frequency_scale = frequency
         self.phase_offset = phase
         
         if self.current_concept:
-            # Re-calculate with new parameters
-            n_terms = len(self.epicycles) if self.epicycles else 10
-            self.set_concept_data(self.current_concept, n_terms)
+            # Rescale the cached epicycles; the concept itself is not regenerated, and
+            # an amplitude-only change just rescales the cached trajectory
+            if retime:
+                self.apply_scales()
+            else:
+                self.apply_amplitude()
+            self.update_limits()
+            self.clear_traces()
+    
+    def init_animation(self):
+        """FuncAnimation init_func: the artists that every frame updates"""
+        return self._artists
     
     def animate_frame(self, frame):
         """Enhanced animation function with individual trace tracking"""
-        if not self.is_playing or not self.epicycles:
-            return []
-        
-        # Clear all plots
-        self.ax_epicycles.clear()
-        self.ax_individual.clear()
-        self.ax_combined.clear()
-        
-        # Reconfigure plots
-        self.setup_plots()
-        
-        # Get selected color palette
-        epicycle_colors = get_epicycle_colors('vibrant')
-        
-        # Get current epicycle positions
-        positions = ConceptMath.get_epicycle_chain_positions(self.epicycles, self.current_time)
-        
-        # Draw connecting lines between epicycle centers
-        for i in range(len(positions) - 1):
-            start_pos = positions[i]
-            end_pos = positions[i + 1]
-            color = epicycle_colors[i % len(epicycle_colors)]
-            
-            self.ax_epicycles.plot([start_pos[0], end_pos[0]], [start_pos[1], end_pos[1]], 
-                                color=color, linewidth=2.5, alpha=0.6, linestyle='-')
-        
-        # Draw epicycles with enhanced styling
-        for i, (epicycle, pos) in enumerate(zip(self.epicycles, positions[1:])):
-            center = positions[i]
-            radius = epicycle['radius']
-            color = epicycle_colors[i % len(epicycle_colors)]
-            
-            # Draw circle
-            circle = patches.Circle(center, radius, fill=False, color=color, 
-                                  linewidth=2.5, alpha=0.8, linestyle='-')
-            self.ax_epicycles.add_patch(circle)
-            
-            # Draw radius line
-            self.ax_epicycles.plot([center[0], pos[0]], [center[1], pos[1]], 
-                                color=color, linewidth=3, alpha=0.9, zorder=5)
-            
-            # Draw center and current position
-            self.ax_epicycles.plot(center[0], center[1], 'o', color=color, 
-                                 markersize=6, alpha=0.9, markeredgecolor='white', 
-                                 markeredgewidth=1, zorder=6)
-            self.ax_epicycles.plot(pos[0], pos[1], 'o', color=color, 
-                                 markersize=5, alpha=0.8, zorder=7)
-            
-            # Track individual epicycle trace
-            if self.show_individual_traces:
-                # Calculate individual epicycle contribution
-                individual_value = epicycle['radius'] * np.sin(
-                    epicycle['frequency'] * self.current_time + epicycle['phase']
-                )
-                self.individual_traces[i].append((self.current_time, individual_value))
-                
-                # Limit trace length for performance
-                if len(self.individual_traces[i]) > 1000:
-                    self.individual_traces[i] = self.individual_traces[i][-1000:]
+        if self.is_playing and self._R0.size:
+            self.update_frame()
+        return self._artists
+    
+    def update_frame(self):
+        """Advance one time step, updating the persistent artists in place"""
+        # Look up the precomputed chain for the frame nearest the current time
+        frame_index = int(round(self.current_time / self.time_step)) % len(self._ts)
+        t = self._ts[frame_index]
+        positions = self._positions_all[frame_index]
+        centers = positions[:-1]
+        
+        # Rings, radius lines and chain markers, each as one batch over all epicycles
+        self._ring_lc.set_segments(centers[:, None, :] + self._R[:, None, None] * UNIT_CIRCLE)
+        segments = np.stack((centers, positions[1:]), axis=1)
+        self._chain_lc.set_segments(segments)
+        self._radius_lc.set_segments(segments)
+        self._center_sc.set_offsets(centers)
+        self._point_sc.set_offsets(positions[1:])
+        for collection in (self._chain_lc, self._ring_lc, self._radius_lc,
+                           self._center_sc, self._point_sc):
+            collection.set_visible(True)
+        
+        # Track individual epicycle traces: each contribution is its arm's y component
+        if self.show_individual_traces:
+            _ring_write(self._trace_v, self._trace_count, self._arms_y_all[frame_index])
+            _ring_write(self._trace_t, self._trace_count, t)
+            self._trace_count += 1
         
         # Draw final point with special highlighting
-        if positions:
-            final_pos = positions[-1]
-            self.ax_epicycles.plot(final_pos[0], final_pos[1], 'o', color='white', 
-                                 markersize=12, alpha=0.9, zorder=8)
-            self.ax_epicycles.plot(final_pos[0], final_pos[1], 'o', color='#FF0040', 
-                                 markersize=10, alpha=1.0, zorder=9)
-            self.ax_epicycles.plot(final_pos[0], final_pos[1], 'o', color='#FFFFFF', 
-                                 markersize=4, alpha=1.0, zorder=10)
+        final_pos = positions[-1]
+        for marker in self._final_markers:
+            marker.set_data([final_pos[0]], [final_pos[1]])
+            marker.set_visible(True)
+        
+        # Add to combined trace
+        _ring_write(self._combined_t, self._combined_count, t)
+        _ring_write(self._combined_v, self._combined_count, final_pos[1])
+        self._combined_count += 1
+        
+        # Draw individual traces: one polyline per epicycle over the shared time axis
+        visible = self.show_individual_traces and self._trace_count > 1
+        if visible:
+            values = _ring_view(self._trace_v, self._trace_count)
+            traces = np.empty(values.shape + (2,))
+            traces[:, :, 0] = _ring_view(self._trace_t, self._trace_count)
+            traces[:, :, 1] = values
+            self._individual_lc.set_segments(traces)
             
-            # Add to combined trace
-            self.traced_points.append((self.current_time, final_pos[1]))
-            if len(self.traced_points) > 1000:
-                self.traced_points = self.traced_points[-1000:]
-        
-        # Draw individual traces
-        if self.show_individual_traces:
-            for i, trace in enumerate(self.individual_traces):
-                if len(trace) > 1:
-                    times, values = zip(*trace)
-                    color = epicycle_colors[i % len(epicycle_colors)]
-                    self.ax_individual.plot(times, values, color=color, 
-                                          linewidth=2, alpha=0.7, 
-                                          label=f'Epicycle {i+1}')
-                    
-                    # Mark current position
-                    if times:
-                        self.ax_individual.plot(times[-1], values[-1], 'o', 
-                                              color=color, markersize=5, zorder=5)
+            # Mark current positions
+            self._individual_sc.set_offsets(traces[:, -1])
+        self._individual_lc.set_visible(visible)
+        self._individual_sc.set_visible(visible)
         
         # Draw combined curve
-        if self.traced_points and len(self.traced_points) > 1:
-            times, values = zip(*self.traced_points)
+        if self._combined_count > 1:
+            times = _ring_view(self._combined_t, self._combined_count)
+            values = _ring_view(self._combined_v, self._combined_count)
+            n_points = len(times)
             
-            # Gradient effect for combined curve
-            n_segments = min(len(times) - 1, 50)
-            segment_size = max(1, len(times) // n_segments)
+            # One segment per consecutive pair of samples
+            points = np.column_stack((times, values))
+            segments = np.stack((points[:-1], points[1:]), axis=1)
             
-            gradient_colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FECA57']
+            # Gradient effect: up to 50 color bands, fading in towards the newest samples
+            band_size = max(1, n_points // min(n_points - 1, 50))
+            band = np.arange(n_points - 1) // band_size
+            colors = COMBINED_GRADIENT_RGBA[band % len(COMBINED_GRADIENT_RGBA)]
+            colors[:, 3] = 0.4 + 0.6 * (band * band_size) / n_points
             
-            for i in range(0, len(times) - segment_size, segment_size):
-                end_idx = min(i + segment_size, len(times))
-                segment_times = times[i:end_idx]
-                segment_values = values[i:end_idx]
-                
-                color_idx = (i // segment_size) % len(gradient_colors)
-                color = gradient_colors[color_idx]
-                alpha = 0.4 + 0.6 * (i / len(times))
-                
-                self.ax_combined.plot(segment_times, segment_values, color=color, 
-                                    linewidth=2.5, alpha=alpha, zorder=3)
+            self._combined_lc.set_segments(segments)
+            self._combined_lc.set_color(colors)
+            self._combined_lc.set_visible(True)
             
             # Current position marker
-            self.ax_combined.plot(times[-1], values[-1], 'o', color='#FF0040', 
-                                markersize=8, alpha=1.0, zorder=10)
+            self._combined_marker.set_data([times[-1]], [values[-1]])
+            self._combined_marker.set_visible(True)
         
         # Update time
         self.current_time += self.time_step
         if self.current_time > self.max_time:
             self.current_time = 0
-            self.traced_points = []
-            self.individual_traces = [[] for _ in range(len(self.epicycles))]
-        
-        # Apply theme and update
-        self.apply_theme('dark')
-        
-        return []
+            self.reset_traces()
     
     def start_animation(self):
         """Start the animation"""
         if self.animation is None:
+            # Frame numbers are unbounded and unused, so there is nothing to cache
             self.animation = FuncAnimation(
-                self.fig, self.animate_frame, interval=50, blit=False, cache_frame_data=False
+                self.fig, self.animate_frame, init_func=self.init_animation,
+                frames=itertools.count(), interval=50, blit=True, cache_frame_data=False
             )
+        else:
+            self.animation.resume()
         self.is_playing = True
+        # Artists are now animated, so re-cache a background that excludes them
+        self.redraw_background()
     
     def stop_animation(self):
         """Stop the animation"""
+        if self.animation is not None and self.is_playing:
+            # Pausing un-animates the artists so regular redraws keep showing them
+            self.animation.pause()
         self.is_playing = False
     
+    def clear_traces(self):
+        """Restart traces from t = 0 and redraw the static state"""
+        self.current_time = 0
+        self.reset_traces()
+        self.clear_artists()
+        self.redraw_background()
+    
     def reset_animation(self):
         """Reset animation to beginning"""
-        self.current_time = 0
-        self.traced_points = []
-        self.individual_traces = [[] for _ in range(len(self.epicycles))]
         self.stop_animation()
-        
-        # Redraw static state
-        for ax in [self.ax_epicycles, self.ax_individual, self.ax_combined]:
-            ax.clear()
-        self.setup_plots()
-        self.draw()
+        self.clear_traces()
+
+
+# Plain-text notation -> scientific symbols for formula display, applied in order
+_FORMULA_SYMBOLS = {
+    # Mathematical symbols
+    '*': '·',  # Multiplication dot
+    '**': '^',  # Exponentiation
+    'sqrt': '√',
+    'inf': '∞',
+    '+-': '±',
+    
+    # Fractions and special formatting
+    '1/2': '½',
+    '1/3': '⅓',
+    '1/4': '¼',
+    '3/4': '¾',
+    '2/3': '⅔',
+    'π^2': 'π²',
+}
+
+
+# Pre-formatted formula text by concept type, as (name substring, text) pairs
+_FORMULA_TEMPLATES = {
+    'Fourier Series': (
+        ('Square Wave', """f(x) = (4/π) · Σ (1/n) · sin(n·x)
+                
+where: n = 1, 3, 5, ... (odd harmonics only)
+
+Physical meaning: Approximates a square wave using 
+infinite sum of sine waves with decreasing amplitudes."""),
+        ('Sawtooth Wave', """f(x) = (2/π) · Σ [(-1)^(n+1)/n] · sin(n·x)
+                
+where: n = 1, 2, 3, ... (all positive integers)
+
+Physical meaning: Creates sawtooth pattern through
+alternating positive/negative harmonic contributions."""),
+        ('Triangle Wave', """f(x) = (8/π²) · Σ [(-1)^((n-1)/2)/n²] · sin(n·x)
+                
+where: n = 1, 3, 5, ... (odd harmonics only)
+
+Physical meaning: Smooth triangular waveform with
+rapidly decreasing harmonic amplitudes (1/n²)."""),
+    ),
+    'Parametric': (
+        ('Lissajous', """Lissajous Curve:
+x(t) = A · sin(a·t + δ)
+y(t) = B · sin(b·t)
+
+Parameters:
+• A, B: amplitudes in x and y directions
+• a, b: frequency ratios
+• δ: phase difference
+• t: parameter (time)
+
+Result: Beautiful closed curves when a/b is rational."""),
+        ('Epicycloid', """Epicycloid (Rolling Circle):
+x(t) = (R + r)·cos(t) - r·cos((R + r)/r · t)
+y(t) = (R + r)·sin(t) - r·sin((R + r)/r · t)
+
+Parameters:
+• R: radius of fixed circle
+• r: radius of rolling circle
+• t: angle parameter
+
+Geometry: Curve traced by point on circle of radius r
+rolling around outside of fixed circle of radius R."""),
+    ),
+    'Taylor Series': (
+        ('Exponential', """Taylor Series for e^x:
+e^x = Σ (x^n)/n! = 1 + x + x²/2! + x³/3! + x⁴/4! + ...
+
+where: n = 0, 1, 2, 3, ... (all non-negative integers)
+
+Convergence: Converges for all real x
+Physical meaning: Describes exponential growth/decay."""),
+        ('Sine', """Taylor Series for sin(x):
+sin(x) = Σ [(-1)^n · x^(2n+1)]/(2n+1)!
+       = x - x³/3! + x⁵/5! - x⁷/7! + ...
+
+where: n = 0, 1, 2, 3, ...
+
+Convergence: Converges for all real x
+Physical meaning: Oscillatory motion representation."""),
+        ('Cosine', """Taylor Series for cos(x):
+cos(x) = Σ [(-1)^n · x^(2n)]/(2n)!
+       = 1 - x²/2! + x⁴/4! - x⁶/6! + ...
+
+where: n = 0, 1, 2, 3, ...
+
+Convergence: Converges for all real x
+Physical meaning: Complement to sine in oscillations."""),
+    ),
+}
 
 
 class FormulaPanel(QWidget):
@@ -429,138 +732,114 @@ class FormulaPanel(QWidget):
         Returns:
             Formatted formula string with proper scientific notation
         """
-        # Dictionary for enhanced mathematical formatting
-        replacements = {
-            # Greek letters (already in Unicode, but ensure consistency)
-            'π': 'π',
-            'Σ': 'Σ',
-            'δ': 'δ',
-            'θ': 'θ',
-            'φ': 'φ',
-            'ω': 'ω',
-            
-            # Mathematical symbols
-            '*': '·',  # Multiplication dot
-            '**': '^',  # Exponentiation
-            'sqrt': '√',
-            'inf': '∞',
-            '+-': '±',
-            
-            # Fractions and special formatting
-            '1/2': '½',
-            '1/3': '⅓',
-            '1/4': '¼',
-            '3/4': '¾',
-            '2/3': '⅔',
-            
-            # Special cases for common expressions
-            '/π': '/π',
-            'π²': 'π²',
-            'π^2': 'π²',
-            
-            # Function formatting
-            'sin(': 'sin(',
-            'cos(': 'cos(',
-            'tan(': 'tan(',
-            'exp(': 'exp(',
-            'log(': 'log(',
-            'ln(': 'ln(',
-        }
-        
         # Apply basic replacements
         formatted_eq = equation
-        for old, new in replacements.items():
+        for old, new in _FORMULA_SYMBOLS.items():
             formatted_eq = formatted_eq.replace(old, new)
         
         # Special formatting for specific concept types
-        if concept_type == "Fourier Series":
-            # Enhanced Fourier series formatting
-            if "Square Wave" in concept_name:
-                formatted_eq = """f(x) = (4/π) · Σ (1/n) · sin(n·x)
-                
-where: n = 1, 3, 5, ... (odd harmonics only)
-
-Physical meaning: Approximates a square wave using 
-infinite sum of sine waves with decreasing amplitudes."""
-            
-            elif "Sawtooth Wave" in concept_name:
-                formatted_eq = """f(x) = (2/π) · Σ [(-1)^(n+1)/n] · sin(n·x)
-                
-where: n = 1, 2, 3, ... (all positive integers)
-
-Physical meaning: Creates sawtooth pattern through
-alternating positive/negative harmonic contributions."""
-            
-            elif "Triangle Wave" in concept_name:
-                formatted_eq = """f(x) = (8/π²) · Σ [(-1)^((n-1)/2)/n²] · sin(n·x)
-                
-where: n = 1, 3, 5, ... (odd harmonics only)
-
-Physical meaning: Smooth triangular waveform with
-rapidly decreasing harmonic amplitudes (1/n²)."""
+        for needle, template in _FORMULA_TEMPLATES.get(concept_type, ()):
+            if needle in concept_name:
+                formatted_eq = template
+                break
         
-        elif concept_type == "Parametric":
-            if "Lissajous" in concept_name:
-                formatted_eq = """Lissajous Curve:
-x(t) = A · sin(a·t + δ)
-y(t) = B · sin(b·t)
+        # Format the header
+        header = f"═══ {concept_name} ═══\nCategory: {concept_type}\n"
+        separator = "─" * 50 + "\n";
+        
+        return header + separator + formatted_eq
 
-Parameters:
-• A, B: amplitudes in x and y directions
-• a, b: frequency ratios
-• δ: phase difference
-• t: parameter (time)
 
-Result: Beautiful closed curves when a/b is rational."""
-            
-            elif "Epicycloid" in concept_name:
-                formatted_eq = """Epicycloid (Rolling Circle):
-x(t) = (R + r)·cos(t) - r·cos((R + r)/r · t)
-y(t) = (R + r)·sin(t) - r·sin((R + r)/r · t)
+# sin/cos terms of a custom equation, captured as (sign, coefficient, function, frequency)
+_TRIG_TERM_RE = re.compile(r'([+-]?)\s*([\d\.]*)\*?(sin|cos)\(([\d\.]*)\*?t\)', re.ASCII)
 
-Parameters:
-• R: radius of fixed circle
-• r: radius of rolling circle
-• t: angle parameter
+# Samples per 2π period when decomposing a custom equation with sympy
+CUSTOM_EQUATION_SAMPLES = 1024
 
-Geometry: Curve traced by point on circle of radius r
-rolling around outside of fixed circle of radius R."""
-        
-        elif concept_type == "Taylor Series":
-            if "Exponential" in concept_name:
-                formatted_eq = """Taylor Series for e^x:
-e^x = Σ (x^n)/n! = 1 + x + x²/2! + x³/3! + x⁴/4! + ...
+# sympy names a custom equation may use; parse_expr evaluates against nothing else
+_EQUATION_NAMES = ('sin', 'cos', 'tan', 'cot', 'sec', 'csc', 'asin', 'acos', 'atan',
+                   'sinh', 'cosh', 'tanh', 'exp', 'log', 'sqrt', 'Abs', 'sign',
+                   'floor', 'ceiling', 'pi', 'E',
+                   # Emitted by parse_expr's number and symbol transformations
+                   'Integer', 'Float', 'Rational', 'Symbol')
 
-where: n = 0, 1, 2, 3, ... (all non-negative integers)
 
-Convergence: Converges for all real x
-Physical meaning: Describes exponential growth/decay."""
-            
-            elif "Sine" in concept_name:
-                formatted_eq = """Taylor Series for sin(x):
-sin(x) = Σ [(-1)^n · x^(2n+1)]/(2n+1)!
-       = x - x³/3! + x⁵/5! - x⁷/7! + ...
+@lru_cache(maxsize=32)
+def _compile_equation(equation_str: str):
+    """Parse a custom equation once into a vectorized NumPy function of t"""
+    # Dunder attribute access is the only way out of the restricted namespace
+    if '__' in equation_str:
+        raise ValueError(f"Could not parse equation: {equation_str}")
+    
+    t = sympy.Symbol('t', real=True)
+    global_dict = {name: getattr(sympy, name) for name in _EQUATION_NAMES}
+    global_dict.update(__builtins__={}, abs=sympy.Abs, e=sympy.E, t=t)
+    try:
+        # 'np.' prefixes are accepted as in the dialog's examples
+        expr = sympy.sympify(parse_expr(equation_str.replace('np.', ''), global_dict=global_dict,
+                                        transformations=standard_transformations + (convert_xor,)))
+    except (sympy.SympifyError, SyntaxError, TokenError, NameError, TypeError, AttributeError) as e:
+        raise ValueError(f"Could not parse equation: {equation_str}") from e
+    
+    unknown = expr.free_symbols - {t}
+    if unknown:
+        raise ValueError(f"Unknown symbols in equation: {', '.join(sorted(map(str, unknown)))}")
+    
+    # Poles (e.g. tan(t)) sample to huge but finite values that swamp the series
+    period = sympy.Interval.Ropen(0, 2 * sympy.pi)
+    try:
+        singular = continuous_domain(expr, t, period) != period
+    except NotImplementedError:
+        singular = False  # e.g. sign/floor, whose jumps are fine
+    if singular:
+        raise ValueError("Equation must be continuous for 0 ≤ t < 2π")
+    return sympy.lambdify(t, expr, 'numpy')
 
-where: n = 0, 1, 2, 3, ...
 
-Convergence: Converges for all real x
-Physical meaning: Oscillatory motion representation."""
-            
-            elif "Cosine" in concept_name:
-                formatted_eq = """Taylor Series for cos(x):
-cos(x) = Σ [(-1)^n · x^(2n)]/(2n)!
-       = 1 - x²/2! + x⁴/4! - x⁶/6! + ...
+def _sample_equation(equation_str: str) -> np.ndarray:
+    """Evaluate a custom equation over one 2π period"""
+    function = _compile_equation(equation_str)
+    t = np.linspace(0, 2 * np.pi, CUSTOM_EQUATION_SAMPLES, endpoint=False)
+    with np.errstate(all='ignore'):
+        # Constant expressions evaluate to a scalar
+        samples = np.broadcast_to(function(t), t.shape)
+        next_period = np.broadcast_to(function(t + 2 * np.pi), t.shape)
+    if np.iscomplexobj(samples) or not np.all(np.isfinite(samples)):
+        raise ValueError("Equation must be real and finite for 0 ≤ t < 2π")
+    # The animation repeats the decomposed period, so anything else would jump each cycle;
+    # a few samples may differ where a jump (e.g. sign(sin(t))) lands exactly on one
+    periodic = np.isclose(next_period, samples, rtol=1e-6, atol=1e-6 * np.abs(samples).max())
+    if periodic.mean() < 0.99:
+        raise ValueError("Equation must be periodic with period 2π")
+    return samples.astype(np.float64)
 
-where: n = 0, 1, 2, 3, ...
 
-Convergence: Converges for all real x
-Physical meaning: Complement to sine in oscillations."""
-        
-        # Format the header
-        header = f"═══ {concept_name} ═══\nCategory: {concept_type}\n"
-        separator = "─" * 50 + "\n";
-        
-        return header + separator + formatted_eq
+class GifEncoderThread(QThread):
+    """Encodes GIF frames on a worker thread while the GUI thread renders them"""
+    
+    def __init__(self, file_path: str, fps: int, parent=None):
+        super().__init__(parent)
+        self.file_path = file_path
+        self.fps = fps
+        self.error = None
+        # Bounded so rendering cannot run far ahead of encoding; None ends the stream
+        self.frames = queue.Queue(maxsize=8)
+    
+    def run(self):
+        # Fast octree quantization per frame instead of Pillow's default median cut;
+        # 128 colors cover the plot's few hues and their antialiasing ramps
+        frames = iter(self.frames.get, None)
+        images = (image.quantize(128, method=QUANTIZE_FASTOCTREE, dither=DITHER_NONE)
+                  for image in frames)
+        try:
+            first = next(images, None)
+            if first is not None:
+                first.save(self.file_path, save_all=True, append_images=images,
+                           duration=int(1000 / self.fps), loop=0)
+        except Exception as e:
+            self.error = str(e)
+            for _ in frames:  # Keep draining so the renderer never blocks
+                pass
 
 
 class EnhancedMainWindow(QMainWindow):
@@ -609,11 +888,16 @@ class EnhancedMainWindow(QMainWindow):
         self.formula_panel = FormulaPanel()
         left_layout.addWidget(self.formula_panel)
         
-        # Connect parameter changes to animation updates
-        self.formula_panel.amplitude_slider.valueChanged.connect(self.on_parameters_changed)
-        self.formula_panel.frequency_slider.valueChanged.connect(self.on_parameters_changed)
-        self.formula_panel.phase_slider.valueChanged.connect(self.on_parameters_changed)
-        self.formula_panel.show_individual_cb.toggled.connect(self.on_parameters_changed)
+        # Connect parameter changes to animation updates, coalescing bursts of
+        # spinbox edits into a single update once they settle
+        self._param_timer = QTimer(self)
+        self._param_timer.setSingleShot(True)
+        self._param_timer.setInterval(50)
+        self._param_timer.timeout.connect(self.on_parameters_changed)
+        self.formula_panel.amplitude_slider.valueChanged.connect(self.queue_parameters_changed)
+        self.formula_panel.frequency_slider.valueChanged.connect(self.queue_parameters_changed)
+        self.formula_panel.phase_slider.valueChanged.connect(self.queue_parameters_changed)
+        self.formula_panel.show_individual_cb.toggled.connect(self.queue_parameters_changed)
         
         splitter.addWidget(left_panel)
         
@@ -645,7 +929,7 @@ class EnhancedMainWindow(QMainWindow):
         # Number of terms
         layout.addWidget(QLabel("Number of Terms:"), 1, 0)
         self.terms_spinbox = QSpinBox()
-        self.terms_spinbox.setRange(1, 25)
+        self.terms_spinbox.setRange(1, MAX_EPICYCLES)
         self.terms_spinbox.setValue(10)
         self.terms_spinbox.valueChanged.connect(self.on_terms_changed)
         layout.addWidget(self.terms_spinbox, 1, 1)
@@ -721,6 +1005,10 @@ class EnhancedMainWindow(QMainWindow):
         """Handle change in number of terms"""
         self.on_concept_changed()  # Reload with new number of terms
     
+    def queue_parameters_changed(self):
+        """Restart the debounce timer; the update runs once edits pause"""
+        self._param_timer.start()
+    
     def on_parameters_changed(self):
         """Handle parameter changes from the formula panel"""
         params = self.formula_panel.get_parameters()
@@ -734,8 +1022,9 @@ class EnhancedMainWindow(QMainWindow):
     def on_theme_changed(self):
         """Handle theme change"""
         theme = self.theme_dropdown.currentText().lower()
-        self.canvas.apply_theme(theme)
-        self.canvas.draw()
+        if theme != self.canvas.theme_name:
+            self.canvas.apply_theme(theme)
+            self.canvas.redraw_background()
     
     def toggle_animation(self):
         """Toggle animation play/pause"""
@@ -764,31 +1053,29 @@ class EnhancedMainWindow(QMainWindow):
         """Save current visualization as image"""
         try:
             # Create assets directory if it doesn't exist
-            assets_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'assets')
-            os.makedirs(assets_dir, exist_ok=True)
+            os.makedirs(_ASSETS_DIR, exist_ok=True)
             
             # Generate filename
             concept_name = "unknown"
             if self.canvas.current_concept:
                 concept_name = self.canvas.current_concept.get('name', 'unknown').lower().replace(' ', '_')
             
-            filename = os.path.join(assets_dir, f"{concept_name}_enhanced_visualization.png")
+            filename = os.path.join(_ASSETS_DIR, f"{concept_name}_enhanced_visualization.png")
             
-            # Save the figure
-            self.canvas.fig.savefig(filename, dpi=300, bbox_inches='tight', 
-                                  facecolor=self.canvas.fig.get_facecolor())
+            # Save the figure; a plot-like image gains little from heavier PNG compression
+            self.canvas.fig.savefig(filename, dpi=150, bbox_inches=self.canvas.tight_bbox(), 
+                                  facecolor=self.canvas.fig.get_facecolor(),
+                                  pil_kwargs={'compress_level': 3})
             
             status_bar = self.statusBar()
             if status_bar:
                 status_bar.showMessage(f"Image saved: {filename}")
             
             # Show success message
-            from PyQt5.QtWidgets import QMessageBox
             QMessageBox.information(self, "Save Successful", 
                                   f"Enhanced visualization saved to:\n{filename}")
             
         except Exception as e:
-            from PyQt5.QtWidgets import QMessageBox
             QMessageBox.critical(self, "Save Error", 
                                f"Failed to save image:\n{str(e)}")
             status_bar = self.statusBar()
@@ -797,11 +1084,6 @@ class EnhancedMainWindow(QMainWindow):
     
     def save_gif(self):
         """Save the current animation as a GIF file"""
-        from PyQt5.QtWidgets import QFileDialog, QProgressDialog, QApplication, QMessageBox
-        from PyQt5.QtCore import Qt
-        import matplotlib.animation as animation
-        import os
-        import numpy as np
         
         # Defensive: handle None for current_concept
         concept_name = "animation"
@@ -829,35 +1111,30 @@ class EnhancedMainWindow(QMainWindow):
             if was_playing:
                 self.canvas.stop_animation()
             
-            # Reset animation to beginning
-            self.canvas.current_time = 0
-            self.canvas.traced_points = []
-            self.canvas.individual_traces = [[] for _ in range(len(self.canvas.epicycles))]
-            
-            # Parameters for GIF creation
-            frames = 120  # Number of frames for full cycle
-            fps = 20     # Frames per second
-            
-            def animate_frame(frame):
-                if progress.wasCanceled():
-                    return []
-                progress.setValue(int((frame / frames) * 100))
-                QApplication.processEvents()
-                self.canvas.current_time = (frame / frames) * self.canvas.max_time
-                self.canvas.ax_epicycles.clear()
-                self.canvas.ax_individual.clear()
-                self.canvas.ax_combined.clear()
-                self.canvas.setup_plots()
-                self.canvas.animate_frame(frame)
-                # Return an empty list (no blitting)
-                return []
+            frames = GIF_FRAMES
+            fps = GIF_FPS
+            progress_step = max(1, frames // 20)
             
-            ani = animation.FuncAnimation(
-                self.canvas.fig, animate_frame, frames=frames,
-                interval=1000/fps, blit=False, repeat=False
-            )
-            progress.setLabelText("Saving GIF file...")
-            ani.save(file_path, writer='pillow', fps=fps)
+            # Matplotlib stays on the GUI thread; Pillow encodes frames as they arrive
+            encoder = GifEncoderThread(file_path, fps, self)
+            encoder.start()
+            try:
+                # Frames come straight from the Agg buffer; the axes are never rebuilt
+                for i, frame in enumerate(self.canvas.iter_frame_images(frames)):
+                    if progress.wasCanceled():
+                        break
+                    # Update the dialog and pump events about every 5%, not every frame
+                    if i % progress_step == 0:
+                        progress.setValue(int((i / frames) * 100))
+                        QApplication.processEvents()
+                    encoder.frames.put(Image.fromarray(frame))
+            finally:
+                encoder.frames.put(None)
+                # Keep the UI responsive while the encoder finishes
+                while not encoder.wait(50):
+                    QApplication.processEvents()
+            if encoder.error:
+                raise RuntimeError(encoder.error)
             progress.setValue(100)
             if was_playing:
                 self.canvas.start_animation()
@@ -868,15 +1145,67 @@ class EnhancedMainWindow(QMainWindow):
             progress.close()
     
     def save_video(self):
-        from PyQt5.QtWidgets import QMessageBox
-        QMessageBox.information(self, "Coming Soon", "Video export (MP4) will be available in a future update!")
+        """Save one full animation cycle as an MP4 video"""
+        if not HAS_IMAGEIO:
+            QMessageBox.information(self, "Video Export",
+                                    "MP4 export requires imageio with ffmpeg:\npip install imageio[ffmpeg]")
+            return
+        
+        concept_name = "animation"
+        if self.canvas.current_concept and 'name' in self.canvas.current_concept:
+            concept_name = self.canvas.current_concept['name'].lower().replace(' ', '_')
+        
+        # Get save location
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Save Animation as Video", 
+            os.path.join("assets", f"{concept_name}_animation.mp4"),
+            "MP4 files (*.mp4)"
+        )
+        
+        if not file_path:
+            return
+        
+        n_frames = self.canvas.n_frames
+        progress = QProgressDialog("Creating video...", "Cancel", 0, n_frames, self)
+        progress.setWindowModality(Qt.WindowModal)
+        progress.show()
+        
+        try:
+            was_playing = self.canvas.is_playing
+            if was_playing:
+                self.canvas.stop_animation()
+            
+            # Frames are pulled straight from the Agg buffer and streamed to ffmpeg;
+            # libx264's yuv420p output needs even dimensions, so imageio rounds odd sizes up
+            writer = imageio.get_writer(
+                file_path, fps=round(1 / self.canvas.time_step), codec='libx264',
+                macro_block_size=2, ffmpeg_params=['-preset', 'ultrafast']
+            )
+            progress_step = max(1, n_frames // 20)
+            try:
+                for i, frame in enumerate(self.canvas.iter_frame_images()):
+                    if progress.wasCanceled():
+                        break
+                    writer.append_data(frame)
+                    # Update the dialog and pump events about every 5%, not every frame
+                    if (i + 1) % progress_step == 0:
+                        progress.setValue(i + 1)
+                        QApplication.processEvents()
+            finally:
+                writer.close()
+            
+            if was_playing:
+                self.canvas.start_animation()
+            QMessageBox.information(self, "Success", f"Video saved successfully to:\n{file_path}")
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to save video:\n{str(e)}")
+        finally:
+            progress.close()
     
     def export_data(self):
-        from PyQt5.QtWidgets import QMessageBox
         QMessageBox.information(self, "Coming Soon", "Data export (CSV/JSON) will be available in a future update!")
     
     def show_advanced_features(self):
-        from PyQt5.QtWidgets import QMessageBox
         QMessageBox.information(self, "Advanced Features", (
             "Planned advanced features include:\n"
             "- Mouse interaction with epicycles\n"
@@ -889,7 +1218,6 @@ class EnhancedMainWindow(QMainWindow):
     
     def open_custom_equation_dialog(self):
         """Open dialog for custom equation input"""
-        from PyQt5.QtWidgets import QDialog, QVBoxLayout, QTextEdit, QPushButton, QLabel, QComboBox, QLineEdit
         
         dialog = QDialog(self)
         dialog.setWindowTitle("Custom Equation Input")
@@ -908,7 +1236,7 @@ Variables: use 't' for time parameter
 Examples:
 • Fourier-like: A*sin(n*t) + B*cos(m*t)
 • Custom wave: sin(t) + 0.5*sin(3*t) + 0.25*sin(5*t)
-• Exponential: exp(-t/2)*sin(t)
+• Exponential: exp(cos(t))*sin(t)
         """)
         layout.addWidget(instructions)
         
@@ -960,7 +1288,6 @@ Examples:
                 dialog.accept()
                 
             except Exception as e:
-                from PyQt5.QtWidgets import QMessageBox
                 QMessageBox.critical(dialog, "Error", f"Invalid equation:\n{str(e)}")
         
         apply_button.clicked.connect(apply_custom_equation)
@@ -974,17 +1301,13 @@ Examples:
             # Set the custom concept in canvas
             n_terms = self.terms_spinbox.value()
             
-            # Generate custom epicycles from the equation
-            custom_epicycles = self.generate_custom_epicycles(
+            # Generate custom epicycle arrays from the equation
+            radii, frequencies, phases = self.generate_custom_epicycles(
                 custom_concept.get("custom_function", "sin(t)"), n_terms
             )
             
             # Update canvas with custom data
-            self.canvas.current_concept = custom_concept
-            self.canvas.epicycles = custom_epicycles
-            self.canvas.individual_traces = [[] for _ in range(len(custom_epicycles))]
-            self.canvas.traced_points = []
-            self.canvas.current_time = 0
+            self.canvas.load_epicycles(custom_concept, radii, frequencies, phases)
             
             # Update formula panel
             self.formula_panel.update_formula(custom_concept)
@@ -994,59 +1317,45 @@ Examples:
             if status_bar:
                 status_bar.showMessage(f"Loaded custom equation: {custom_concept['name']}")
             
-            self.canvas.draw()
-            
         except Exception as e:
-            from PyQt5.QtWidgets import QMessageBox
             QMessageBox.critical(self, "Error", f"Failed to apply custom equation:\n{str(e)}")
     
     def generate_custom_epicycles(self, equation_str: str, n_terms: int):
-        """Generate epicycles from a custom equation string"""
-        import re
-        
-        # Simple parser for basic trigonometric functions
-        # This is a simplified version - you could make it more sophisticated
-        
-        epicycles = []
-        
-        # Try to extract sin/cos terms with their coefficients and frequencies
-        sin_pattern = r'([\d\.]*)\*?sin\(([\d\.]*)\*?t\)'
-        cos_pattern = r'([\d\.]*)\*?cos\(([\d\.]*)\*?t\)'
-        
-        sin_matches = re.findall(sin_pattern, equation_str)
-        cos_matches = re.findall(cos_pattern, equation_str)
+        """
+        Generate epicycles from a custom equation string.
         
-        # Add sin terms
-        for coeff, freq in sin_matches:
-            amplitude = float(coeff) if coeff else 1.0
-            frequency = float(freq) if freq else 1.0
-            
-            epicycles.append({
-                'radius': abs(amplitude),
-                'frequency': frequency,
-                'phase': 0 if amplitude >= 0 else np.pi,  # Phase shift for negative amplitudes
-                'direction': 1
-            })
-        
-        # Add cos terms  
-        for coeff, freq in cos_matches:
-            amplitude = float(coeff) if coeff else 1.0
-            frequency = float(freq) if freq else 1.0
+        Returns:
+            Tuple of (radii, frequencies, phases) float64 arrays, as from epicycle_arrays
+        """
+        # A sum of literal sin/cos terms maps exactly onto epicycles, including non-integer
+        # frequencies that a 2π-periodic decomposition could only approximate
+        equation = equation_str.replace('np.', '')
+        literal_terms = (_TRIG_TERM_RE.search(equation) is not None and
+                         not _TRIG_TERM_RE.sub('', equation).strip())
+        
+        if HAS_SYMPY and not literal_terms:
+            # Decompose any other expression sympy can parse into its sine series
+            radii, frequencies, phases = sine_series_arrays(_sample_equation(equation_str), n_terms)
+        else:
+            # Parse the literal sin/cos terms (without sympy, whatever terms can be found),
+            # keeping at most n_terms of them
+            matches = _TRIG_TERM_RE.findall(equation)[:n_terms]
+            radii = np.empty(len(matches))
+            frequencies = np.empty(len(matches))
+            phases = np.empty(len(matches))
             
-            epicycles.append({
-                'radius': abs(amplitude),
-                'frequency': frequency,
-                'phase': np.pi/2 if amplitude >= 0 else 3*np.pi/2,  # cos = sin with π/2 phase shift
-                'direction': 1
-            })
-        
-        # If no matches found, create a simple default
-        if not epicycles:
-            epicycles.append({
-                'radius': 1.0,
-                'frequency': 1.0,
-                'phase': 0,
-                'direction': 1
-            })
-        
-        return epicycles[:n_terms]  # Limit to requested number of terms
+            for i, (sign, coeff, function, freq) in enumerate(matches):
+                amplitude = float(coeff) if coeff else 1.0
+                if sign == '-':
+                    amplitude = -amplitude
+                radii[i] = abs(amplitude)
+                frequencies[i] = float(freq) if freq else 1.0
+                # cos = sin with π/2 phase shift; a negative amplitude adds π
+                phases[i] = 0.0 if function == 'sin' else np.pi / 2
+                if amplitude < 0:
+                    phases[i] += np.pi
+        
+        # If nothing was found (or the function is zero), use a simple default
+        if not radii.size:
+            return np.ones(1), np.ones(1), np.zeros(1)
+        return radii, frequencies, phases
@@ -5,25 +5,105 @@ Integrates with the JSON concepts file to provide dynamic equation selection.
 
 import sys
 import os
+import time
+import itertools
+from collections import deque
+from functools import lru_cache
 import numpy as np
 from typing import List, Dict, Any, Optional
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                              QComboBox, QPushButton, QLabel, QSlider, QSpinBox,
-                             QGroupBox, QGridLayout, QSizePolicy, QMessageBox)
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal
+                             QGroupBox, QGridLayout, QSizePolicy, QMessageBox, QCheckBox)
+from PyQt5.QtCore import Qt, QTimer, QThread, pyqtSignal
 from PyQt5.QtGui import QFont, QPalette, QColor
 
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 from matplotlib.animation import FuncAnimation
-import matplotlib.patches as patches
+from matplotlib.collections import LineCollection
 
 # Import our custom utilities
 from utils.concept_loader import (load_visualization_concepts, get_dropdown_options, 
                                  parse_dropdown_selection, get_all_concepts_flat)
-from utils.math_utils import generate_curve_from_concept, ConceptMath
-from config.themes import get_theme_colors
+from utils.math_utils import generate_curve_from_concept, epicycle_arrays
+from utils.epicycle_kernels import compute_chain
+from config.themes import get_theme_rgb, get_epicycle_colors, get_curve_gradient_array
+
+
+# Animation timer interval, and the most time steps one redraw may cover when
+# drawing cannot keep up with it
+FRAME_INTERVAL_MS = 50
+MAX_FRAME_SKIP = 8
+
+# Unit circle polyline that every epicycle ring is scaled and shifted from
+_RING_ANGLES = np.linspace(0, 2 * np.pi, 65)
+UNIT_CIRCLE = np.column_stack((np.cos(_RING_ANGLES), np.sin(_RING_ANGLES)))
+
+# Number of samples kept in each trace ring buffer
+TRACE_LENGTH = 1000
+
+
+def _ring_write(buffer: np.ndarray, count: int, values: np.ndarray):
+    """
+    Store samples number `count`, `count + 1`, ... in a mirrored ring buffer.
+    
+    The buffer holds two copies of a TRACE_LENGTH ring along its last axis,
+    so the latest samples are always one contiguous slice.
+    
+    Args:
+        buffer: Ring buffer of shape (..., 2 * TRACE_LENGTH)
+        count: Number of samples written so far
+        values: New samples along the last axis (at most TRACE_LENGTH)
+    """
+    slots = (count + np.arange(values.shape[-1])) % TRACE_LENGTH
+    buffer[..., slots] = values
+    buffer[..., slots + TRACE_LENGTH] = values
+
+
+def _ring_view(buffer: np.ndarray, count: int) -> np.ndarray:
+    """Zero-copy view of a mirrored ring buffer's samples in write order"""
+    if count <= TRACE_LENGTH:
+        return buffer[..., :count]
+    start = count % TRACE_LENGTH
+    return buffer[..., start:start + TRACE_LENGTH]
+
+
+@lru_cache(maxsize=64)
+def _concept_curve(category: str, name: str, n_terms: int):
+    """
+    Curve and epicycles of a built-in concept, cached per term count.
+    
+    The generated data depends only on the concept's category and name, so
+    switching back to a concept/term combination reuses the earlier result.
+    The arrays, epicycle records included, are returned read-only.
+    """
+    curve_x, curve_y, epicycles = generate_curve_from_concept(
+        {'name': name, 'category': category}, n_terms, 1000
+    )
+    curve_x = np.asarray(curve_x)
+    curve_y = np.asarray(curve_y)
+    for array in (curve_x, curve_y, epicycles):
+        array.setflags(write=False)
+    return curve_x, curve_y, epicycles
+
+
+class CurveWorker(QThread):
+    """Generates a concept's curve and epicycles off the GUI thread"""
+    
+    # Request token, concept, and its (curve_x, curve_y, epicycles)
+    curve_ready = pyqtSignal(int, object, object)
+    
+    def __init__(self, token: int, concept: Dict[str, Any], n_terms: int, parent=None):
+        super().__init__(parent)
+        self.token = token
+        self.concept = concept
+        self.n_terms = n_terms
+    
+    def run(self):
+        data = _concept_curve(self.concept.get('category', ''), self.concept.get('name', ''),
+                              self.n_terms)
+        self.curve_ready.emit(self.token, self.concept, data)
 
 
 class AnimationCanvas(FigureCanvas):
@@ -43,27 +123,27 @@ class AnimationCanvas(FigureCanvas):
         self.is_playing = False
         self.current_time = 0
         self.time_step = 0.05
+        self._frame_periods = deque(maxlen=20)  # Recent wall times between frames
+        self._last_frame_at = None
         self.max_time = 4 * np.pi        # Data storage
         self.epicycles = []
         self.curve_x = []
         self.curve_y = []
-        self.traced_points = []
-        self.individual_traces = []  # Store traces for each epicycle
         self.current_concept = None
         
         # Adjustable parameters
         self.amplitude_scale = 1.0
         self.frequency_scale = 1.0
         self.phase_offset = 0.0
-        self.traced_points = []
-        self.individual_traces = []  # Store traces for each epicycle
         self.current_concept = None
         
-        # Visual elements
-        self.epicycle_circles = []
-        self.epicycle_lines = []
+        # Visual elements (persistent artists, rebuilt for each concept)
+        self.epicycle_circles = None
+        self.epicycle_lines = None
         self.curve_line = None
-        self.trace_line = None
+        self._artists = []
+        self.load_epicycle_arrays()
+        self.reset_traces()
         self.setup_plots()
     
     def setup_plots(self):
@@ -96,14 +176,130 @@ class AnimationCanvas(FigureCanvas):
         
         self.fig.tight_layout()
     
+    def create_artists(self):
+        """Create the persistent artists that animate_frame updates in place"""
+        for artist in self._artists:
+            artist.remove()
+        
+        # Get selected color palette
+        palette_name = self.palette_dropdown.currentText().lower() if hasattr(self, 'palette_dropdown') else 'vibrant'
+        epicycle_colors = get_epicycle_colors(palette_name)
+        colors = [epicycle_colors[i % len(epicycle_colors)] for i in range(len(self.epicycles))]
+        ax = self.ax_epicycles
+        
+        # Circles (behind everything), connecting lines between epicycle centers and
+        # radius lines, one collection each over all epicycles
+        self.epicycle_circles = LineCollection([], colors=colors, linewidths=2.5, alpha=0.8, zorder=1)
+        self.chain_lines = LineCollection([], colors=colors, linewidths=2.5, alpha=0.6)
+        self.epicycle_lines = LineCollection([], colors=colors, linewidths=3, alpha=0.9, zorder=5)
+        for collection in (self.epicycle_circles, self.chain_lines, self.epicycle_lines):
+            ax.add_collection(collection)
+        
+        # Center points and current position points, one scatter each
+        self.center_markers = ax.scatter([], [], s=6**2, alpha=0.9, edgecolors='white',
+                                         linewidths=1, zorder=6)
+        self.point_markers = ax.scatter([], [], s=5**2, alpha=0.8, edgecolors='face',
+                                        linewidths=1, zorder=7)
+        for scatter in (self.center_markers, self.point_markers):
+            scatter.set_facecolor(colors)
+        
+        # Multi-layered final point for emphasis
+        self.final_markers = [
+            ax.plot([], [], 'o', color='white', markersize=12, alpha=0.9, zorder=8)[0],
+            ax.plot([], [], 'o', color='#FF0040', markersize=10, alpha=1.0, zorder=9)[0],
+            ax.plot([], [], 'o', color='#FFFFFF', markersize=4, alpha=1.0, zorder=10)[0],
+        ]
+        
+        # Traced curve: gradient bands, semi-transparent overlay and recent highlight
+        self.gradient_lc = LineCollection([], linewidths=2.5, zorder=3)
+        self.ax_curve.add_collection(self.gradient_lc)
+        self.curve_line = self.ax_curve.plot([], [], '#FFFFFF', linewidth=1, alpha=0.3, zorder=4)[0]
+        self.recent_line = self.ax_curve.plot([], [], '#FF0040', linewidth=3, alpha=0.8, zorder=5)[0]
+        
+        # Multi-layered current position marker with guide lines to the axes
+        self.curve_markers = [
+            self.ax_curve.plot([], [], 'o', color='white', markersize=12, alpha=0.9, zorder=8)[0],
+            self.ax_curve.plot([], [], 'o', color='#FF0040', markersize=10, alpha=1.0, zorder=9)[0],
+            self.ax_curve.plot([], [], 'o', color='#FFFFFF', markersize=4, alpha=1.0, zorder=10)[0],
+        ]
+        self.curve_vline = self.ax_curve.axvline(x=0, color='#FF0040', linewidth=1, alpha=0.4,
+                                                 linestyle='--', zorder=1)
+        self.curve_hline = self.ax_curve.axhline(y=0, color='#FF0040', linewidth=1, alpha=0.4,
+                                                 linestyle='--', zorder=1)
+        
+        self._artists = [self.epicycle_circles, self.chain_lines, self.epicycle_lines,
+                         self.center_markers, self.point_markers, *self.final_markers,
+                         self.gradient_lc, self.curve_line, self.recent_line,
+                         *self.curve_markers, self.curve_vline, self.curve_hline]
+        self.clear_artists()
+    
+    def load_epicycle_arrays(self):
+        """Pack the epicycles into arrays and precompute one animation cycle"""
+        self._r, self._f, self._p = epicycle_arrays(self.epicycles)
+        
+        # The animation always steps through the same times, so the chain positions
+        # (origin first) at every one of them are evaluated once, up front
+        self._ts = np.arange(int(self.max_time / self.time_step) + 1) * self.time_step
+        self._positions_all = compute_chain(self._r, self._f, self._p, self._ts)
+    
+    def reset_traces(self):
+        """Allocate empty ring buffers for the traced curve"""
+        # Traced curve (final point's y over time)
+        self._trace_t = np.empty(2 * TRACE_LENGTH)
+        self._trace_y = np.empty(2 * TRACE_LENGTH)
+        self.restart_trace()
+    
+    def restart_trace(self):
+        """Empty the traced curve (its buffers are reused)"""
+        self._trace_count = 0
+        self._gradient_layout = None  # (n_bands, segment_size) the gradient was built for
+    
+    def frames_to_advance(self) -> int:
+        """
+        Number of time steps the next frame should cover.
+        
+        When frames arrive slower than the timer interval (drawing cannot keep
+        up), several steps are sampled per redraw so the animation keeps its pace.
+        """
+        now = time.perf_counter()
+        if self._last_frame_at is not None:
+            self._frame_periods.append(now - self._last_frame_at)
+        self._last_frame_at = now
+        if not self._frame_periods:
+            return 1
+        
+        skip = int(sum(self._frame_periods) / len(self._frame_periods) * 1000 / FRAME_INTERVAL_MS)
+        # Stop at the end of the cycle, where the trace restarts
+        remaining = len(self._ts) - self.frame_index()
+        return max(1, min(skip, MAX_FRAME_SKIP, remaining))
+    
+    def frame_index(self) -> int:
+        """Index of the current time in the precomputed cycle"""
+        return int(round(self.current_time / self.time_step))
+    
+    def clear_artists(self):
+        """Hide every animated artist until the next frame updates it"""
+        for artist in self._artists:
+            artist.set_visible(False)
+    
+    def redraw_background(self):
+        """Redraw the static figure and drop stale blitting backgrounds"""
+        # Backgrounds are cached per axes view, so theme/title changes must evict them.
+        # Matplotlib has no public hook for this (a synthetic resize event would also
+        # resume a paused animation), so the private cache is cleared only if present.
+        blit_cache = getattr(self.animation, '_blit_cache', None)
+        if blit_cache is not None:
+            blit_cache.clear()
+        self.draw()
+    
     def apply_theme(self, theme_name: str = 'dark'):
         """Apply color theme to the plots"""
-        colors = get_theme_colors(theme_name)
+        colors = get_theme_rgb(theme_name)
           # Set background colors
         self.fig.patch.set_facecolor(colors['background'])
-        self.ax_epicycles.set_facecolor(colors['plot_background'])
-        self.ax_curve.set_facecolor(colors['plot_background'])
-        self.ax_individual.set_facecolor(colors['plot_background'])
+        self.ax_epicycles.set_facecolor(colors['canvas_bg'])
+        self.ax_curve.set_facecolor(colors['canvas_bg'])
+        self.ax_individual.set_facecolor(colors['canvas_bg'])
         
         # Set text colors
         for ax in [self.ax_epicycles, self.ax_curve, self.ax_individual]:
@@ -118,24 +314,30 @@ class AnimationCanvas(FigureCanvas):
     
     def set_concept_data(self, concept: Dict[str, Any], n_terms: int = 10):
         """Set the mathematical concept to visualize"""
-        self.current_concept = concept
-        
         # Generate curve and epicycle data
-        self.curve_x, self.curve_y, self.epicycles = generate_curve_from_concept(
-            concept, n_terms, 1000
-        )
-          # Reset traced points and individual traces
-        self.traced_points = []
-        self.individual_traces = [[] for _ in range(len(self.epicycles))]
+        self.apply_curve_data(concept, *_concept_curve(
+            concept.get('category', ''), concept.get('name', ''), n_terms
+        ))
+    
+    def apply_curve_data(self, concept: Dict[str, Any], curve_x: np.ndarray,
+                         curve_y: np.ndarray, epicycles):
+        """Show a concept whose curve and epicycles have already been generated"""
+        self.current_concept = concept
+        self.curve_x, self.curve_y, self.epicycles = curve_x, curve_y, epicycles
         self.current_time = 0
+        self.load_epicycle_arrays()
+        self.create_artists()
+        
+        # Reset traced points
+        self.reset_traces()
         
-        # Update plot limits based on data
+        # Update plot limits based on data; they stay fixed while animating
         if len(self.curve_y) > 0:
-            y_range = max(abs(np.max(self.curve_y)), abs(np.min(self.curve_y)))
+            y_range = float(np.abs(self.curve_y).max())
             self.ax_curve.set_ylim(-y_range * 1.2, y_range * 1.2)
         
         # Calculate epicycle system range
-        total_radius = sum(ep['radius'] for ep in self.epicycles)
+        total_radius = float(self._r.sum())
         if total_radius > 0:
             margin = total_radius * 1.2
             self.ax_epicycles.set_xlim(-margin, margin)
@@ -147,209 +349,136 @@ class AnimationCanvas(FigureCanvas):
         self.ax_epicycles.set_title(f'Epicycles: {concept_name}', fontsize=14, fontweight='bold')
         self.ax_curve.set_title(f'{concept_type}: {concept_name}', fontsize=14, fontweight='bold')
         
-        self.draw()
+        self.redraw_background()
+    
+    def init_animation(self):
+        """FuncAnimation init_func: the artists that every frame updates"""
+        return self._artists
     
     def animate_frame(self, frame):
         """Animation function called for each frame"""
         if not self.is_playing:
-            return []
-        
-        # Clear previous frame
-        self.ax_epicycles.clear()
-        
-        # Reconfigure epicycles plot
-        total_radius = sum(ep['radius'] for ep in self.epicycles) if self.epicycles else 2
-        margin = total_radius * 1.2
-        self.ax_epicycles.set_xlim(-margin, margin)
-        self.ax_epicycles.set_ylim(-margin, margin)
-        self.ax_epicycles.set_aspect('equal')
-        self.ax_epicycles.grid(True, alpha=0.3)
-        concept_name = self.current_concept.get('name', 'Unknown') if self.current_concept else 'Unknown'
-        self.ax_epicycles.set_title(f'Epicycles: {concept_name}', fontsize=12, fontweight='bold')
-        
-        # Get current epicycle positions
-        positions = ConceptMath.get_epicycle_chain_positions(self.epicycles, self.current_time)
-        
-        # Get selected color palette
-        palette_name = self.palette_dropdown.currentText().lower() if hasattr(self, 'palette_dropdown') else 'vibrant'
-        from config.themes import get_epicycle_colors
-        epicycle_colors = get_epicycle_colors(palette_name)
-        
-        # Draw connecting lines between epicycle centers first (behind circles)
-        for i in range(len(positions) - 1):
-            start_pos = positions[i]
-            end_pos = positions[i + 1]
-            color = epicycle_colors[i % len(epicycle_colors)]
-            
-            # Draw connection line with gradient effect (lighter)
-            self.ax_epicycles.plot([start_pos[0], end_pos[0]], [start_pos[1], end_pos[1]], 
-                                color=color, linewidth=2.5, alpha=0.6, linestyle='-')
-        
-        # Draw epicycles with enhanced styling
-        for i, (epicycle, pos) in enumerate(zip(self.epicycles, positions[1:])):
-            center = positions[i]
-            radius = epicycle['radius']
-            color = epicycle_colors[i % len(epicycle_colors)]
-            
-            # Draw circle with enhanced styling
-            circle = patches.Circle(center, radius, fill=False, color=color, 
-                                  linewidth=2.5, alpha=0.8, linestyle='-')
-            self.ax_epicycles.add_patch(circle)
-            
-            # Draw radius line from center to current position with thicker line
-            self.ax_epicycles.plot([center[0], pos[0]], [center[1], pos[1]], 
-                                color=color, linewidth=3, alpha=0.9, zorder=5)
-            
-            # Draw center point with larger, more visible marker
-            self.ax_epicycles.plot(center[0], center[1], 'o', color=color, 
-                                 markersize=6, alpha=0.9, markeredgecolor='white', 
-                                 markeredgewidth=1, zorder=6)
-            
-            # Draw current position point
-            self.ax_epicycles.plot(pos[0], pos[1], 'o', color=color, 
-                                 markersize=5, alpha=0.8, zorder=7)
-        
-        # Draw final point with special highlighting
-        if positions:
-            final_pos = positions[-1]
-            # Multi-layered final point for emphasis
-            self.ax_epicycles.plot(final_pos[0], final_pos[1], 'o', color='white', 
-                                 markersize=12, alpha=0.9, zorder=8)
-            self.ax_epicycles.plot(final_pos[0], final_pos[1], 'o', color='#FF0040', 
-                                 markersize=10, alpha=1.0, zorder=9)
-            self.ax_epicycles.plot(final_pos[0], final_pos[1], 'o', color='#FFFFFF', 
-                                 markersize=4, alpha=1.0, zorder=10)
-            
-            # Add traced point with color information
-            self.traced_points.append((self.current_time, final_pos[1]))
-            
-            # Limit traced points for performance
-            if len(self.traced_points) > 1000:
-                self.traced_points = self.traced_points[-1000:]
-        
-        # Track individual epicycle traces for each position
-        for i, pos in enumerate(positions[1:]):  # Skip origin position
-            if i < len(self.individual_traces):
-                # Store y-component for each epicycle
-                self.individual_traces[i].append((self.current_time, pos[1]))
-                
-                # Limit individual traces for performance
-                if len(self.individual_traces[i]) > 1000:
-                    self.individual_traces[i] = self.individual_traces[i][-1000:]
+            return self._artists
+        
+        # Precomputed epicycle positions at each time step this frame covers (usually one)
+        skip = self.frames_to_advance()
+        index = self.frame_index()
+        step_times = self._ts[index:index + skip]
+        chains = self._positions_all[index:index + skip]
+        
+        # Only the last time step is drawn
+        positions = chains[-1]
+        
+        # Move the circles, connecting lines, radius lines and points along the chain
+        centers = positions[:-1]
+        self.epicycle_circles.set_segments(centers[:, None, :] + self._r[:, None, None] * UNIT_CIRCLE)
+        segments = np.stack((centers, positions[1:]), axis=1)
+        self.chain_lines.set_segments(segments)
+        self.epicycle_lines.set_segments(segments)
+        self.center_markers.set_offsets(centers)
+        self.point_markers.set_offsets(positions[1:])
+        
+        # Move the final point with special highlighting
+        final_x, final_y = positions[-1]
+        for marker in self.final_markers:
+            marker.set_data([final_x], [final_y])
+        
+        # Add traced points (the ring keeps the latest TRACE_LENGTH samples)
+        _ring_write(self._trace_t, self._trace_count, step_times)
+        _ring_write(self._trace_y, self._trace_count, chains[:, -1, 1])
+        self._trace_count += skip
         
         # Update curve plot
-        if self.traced_points:
-            times, values = zip(*self.traced_points)
-            
-            # Clear and redraw curve
-            self.ax_curve.clear()
-            self.ax_curve.set_xlim(0, self.max_time)
-            
-            if values:
-                y_range = max(abs(max(values)), abs(min(values))) if values else 1
-                self.ax_curve.set_ylim(-y_range * 1.2, y_range * 1.2)
+        times = _ring_view(self._trace_t, self._trace_count)
+        values = _ring_view(self._trace_y, self._trace_count)
+        
+        # Plot traced curve with gradient colors
+        if len(times) > 1:
+            # Gradient effect: consecutive bands of segment_size samples, one polyline each
+            n_segments = min(len(times) - 1, 100)  # Limit for performance
+            segment_size = max(1, len(times) // n_segments)
+            n_bands = -(-(len(times) - segment_size) // segment_size)
             
-            self.ax_curve.grid(True, alpha=0.3)
-            concept_type = self.current_concept.get('type', 'Unknown') if self.current_concept else 'Unknown'
-            self.ax_curve.set_title(f'{concept_type}: {concept_name}', fontsize=14, fontweight='bold')
-            self.ax_curve.set_xlabel('Time (t)')
-            self.ax_curve.set_ylabel('Amplitude')            # Plot traced curve with gradient colors
-            if len(times) > 1:
-                # Get gradient colors from theme configuration
-                from config.themes import get_curve_gradient_colors
-                gradient_colors = get_curve_gradient_colors()
+            # Completed bands never move, so only rebuild the collection when one is added.
+            # Single-sample bands draw nothing and are skipped altogether.
+            if segment_size > 1 and (n_bands, segment_size) != self._gradient_layout:
+                self._gradient_layout = (n_bands, segment_size)
+                points = np.column_stack((times, values))[:n_bands * segment_size]
                 
-                # Draw curve with gradient effect
-                n_segments = min(len(times) - 1, 100)  # Limit for performance
-                segment_size = max(1, len(times) // n_segments)
+                # Pre-interpolated gradient, one RGB row per segment; newer bands more opaque
+                band = np.arange(n_bands)
+                colors = np.empty((n_bands, 4))
+                colors[:, :3] = get_curve_gradient_array(n_segments)[np.minimum(band, n_segments - 1)]
+                colors[:, 3] = 0.4 + 0.6 * (band * segment_size) / len(times)
                 
-                for i in range(0, len(times) - segment_size, segment_size):
-                    end_idx = min(i + segment_size, len(times))
-                    segment_times = times[i:end_idx]
-                    segment_values = values[i:end_idx]
-                    
-                    # Choose color based on position in curve
-                    color_idx = (i // segment_size) % len(gradient_colors)
-                    color = gradient_colors[color_idx]
-                    
-                    # Calculate alpha for fade effect (newer points more opaque)
-                    alpha = 0.4 + 0.6 * (i / len(times))
-                    
-                    self.ax_curve.plot(segment_times, segment_values, color=color, 
-                                     linewidth=2.5, alpha=alpha, zorder=3)
-                
-                # Draw main curve with semi-transparent overlay
-                self.ax_curve.plot(times, values, '#FFFFFF', linewidth=1, alpha=0.3, zorder=4)
-                
-                # Highlight recent portion of curve
-                if len(times) > 20:
-                    recent_times = times[-20:]
-                    recent_values = values[-20:]
-                    self.ax_curve.plot(recent_times, recent_values, '#FF0040', 
-                                     linewidth=3, alpha=0.8, zorder=5)
+                self.gradient_lc.set_segments(points.reshape(n_bands, segment_size, 2))
+                self.gradient_lc.set_color(colors)
             
-            # Plot current position with enhanced styling
-            if times:
-                current_time = times[-1]
-                current_value = values[-1]
-                
-                # Multi-layered current position marker
-                self.ax_curve.plot(current_time, current_value, 'o', color='white', 
-                                 markersize=12, alpha=0.9, zorder=8)
-                self.ax_curve.plot(current_time, current_value, 'o', color='#FF0040', 
-                                 markersize=10, alpha=1.0, zorder=9)
-                self.ax_curve.plot(current_time, current_value, 'o', color='#FFFFFF', 
-                                 markersize=4, alpha=1.0, zorder=10)
-                
-                # Add vertical line from current point to x-axis
-                self.ax_curve.axvline(x=current_time, color='#FF0040', 
-                                    linewidth=1, alpha=0.4, linestyle='--', zorder=1)
-                
-                # Add horizontal line from current point to y-axis
-                self.ax_curve.axhline(y=current_value, color='#FF0040', 
-                                    linewidth=1, alpha=0.4, linestyle='--', zorder=1)
+            # Main curve with semi-transparent overlay
+            self.curve_line.set_data(times, values)
+            
+            # Highlight recent portion of curve
+            self.recent_line.set_data(times[-20:], values[-20:])
+            self.recent_line.set_visible(len(times) > 20)
+        
+        # Plot current position with enhanced styling
+        current_time = times[-1]
+        current_value = values[-1]
+        for marker in self.curve_markers:
+            marker.set_data([current_time], [current_value])
+        
+        # Vertical and horizontal guide lines from the current point to the axes
+        self.curve_vline.set_xdata([current_time, current_time])
+        self.curve_hline.set_ydata([current_value, current_value])
+        
+        for artist in self._artists:
+            if artist is not self.recent_line:
+                artist.set_visible(True)
+        self.gradient_lc.set_visible(self._gradient_layout is not None)
         
         # Update time
-        self.current_time += self.time_step
-        if self.current_time > self.max_time:
+        if index + skip < len(self._ts):
+            self.current_time = self._ts[index + skip]
+        else:
             self.current_time = 0
-            self.traced_points = []
-        
-        # Apply theme colors
-        self.apply_theme('dark')
+            self.restart_trace()
         
-        return []
+        return self._artists
     
     def start_animation(self):
         """Start the animation"""
         if self.animation is None:
+            # Frame numbers are unbounded and unused, so there is nothing to cache
             self.animation = FuncAnimation(
-                self.fig, self.animate_frame, interval=50, blit=False, cache_frame_data=False
+                self.fig, self.animate_frame, init_func=self.init_animation,
+                frames=itertools.count(), interval=FRAME_INTERVAL_MS, blit=True,
+                cache_frame_data=False
             )
+        else:
+            self.animation.resume()
         self.is_playing = True
+        # Frame pacing restarts, so the paused time does not count as a slow frame
+        self._frame_periods = deque(maxlen=20)
+        self._last_frame_at = None
+        # Artists are now animated, so re-cache a background that excludes them
+        self.redraw_background()
     
     def stop_animation(self):
         """Stop the animation"""
+        if self.animation is not None and self.is_playing:
+            # Pausing un-animates the artists so regular redraws keep showing them
+            self.animation.pause()
         self.is_playing = False
     
     def reset_animation(self):
         """Reset animation to beginning"""
         self.current_time = 0
-        self.traced_points = []
+        self.restart_trace()
         self.stop_animation()
         
         # Redraw static state
-        self.ax_epicycles.clear()
-        self.ax_curve.clear()
-        self.setup_plots()
-        
-        if self.current_concept:
-            concept_name = self.current_concept.get('name', 'Unknown')
-            concept_type = self.current_concept.get('type', 'Unknown')
-            self.ax_epicycles.set_title(f'Epicycles: {concept_name}', fontsize=14, fontweight='bold')
-            self.ax_curve.set_title(f'{concept_type}: {concept_name}', fontsize=14, fontweight='bold')
-        
-        self.draw()
+        self.clear_artists()
+        self.redraw_background()
 
 
 class MainWindow(QMainWindow):
@@ -364,6 +493,10 @@ class MainWindow(QMainWindow):
         self.concepts_data = load_visualization_concepts()
         self.dropdown_options = get_dropdown_options()
         
+        # Curve generation runs on worker threads; only the latest request is shown
+        self._curve_token = 0
+        self._curve_workers = []
+        
         # Create UI components
         self.init_ui()
         
@@ -411,6 +544,12 @@ class MainWindow(QMainWindow):
         self.terms_spinbox.setRange(1, 25)
         self.terms_spinbox.setValue(10)
         self.terms_spinbox.valueChanged.connect(self.on_terms_changed)
+        
+        # Coalesce bursts of term changes (e.g. a held arrow key) into one reload
+        self._terms_timer = QTimer(self)
+        self._terms_timer.setSingleShot(True)
+        self._terms_timer.setInterval(150)
+        self._terms_timer.timeout.connect(self.on_concept_changed)
         layout.addWidget(self.terms_spinbox, 1, 1)
         
         # Animation controls
@@ -425,6 +564,10 @@ class MainWindow(QMainWindow):
         self.save_button = QPushButton("💾 Save Image")
         self.save_button.clicked.connect(self.save_image)
         layout.addWidget(self.save_button, 2, 2)
+        
+        # Opt-in 300 DPI export cropped to the artists' tight bounding box
+        self.high_res_checkbox = QCheckBox("High-resolution export")
+        layout.addWidget(self.high_res_checkbox, 2, 3)
           # Theme selection
         layout.addWidget(QLabel("Theme:"), 3, 0)
         self.theme_dropdown = QComboBox()
@@ -443,33 +586,52 @@ class MainWindow(QMainWindow):
     
     def on_concept_changed(self):
         """Handle concept selection change"""
+        self._terms_timer.stop()  # This reload already uses the current number of terms
         selected = self.concept_dropdown.currentText()
         concept = parse_dropdown_selection(selected)
         
         if concept:
             n_terms = self.terms_spinbox.value()
-            self.canvas.set_concept_data(concept, n_terms)
-            
-            # Update status bar
-            concept_name = concept.get('name', 'Unknown')
-            equation = concept.get('equation', 'No equation')
-            status_bar = self.statusBar()
-            if status_bar:
-                status_bar.showMessage(f"Loaded: {concept_name} | {equation}")
+            self._curve_token += 1
+            worker = CurveWorker(self._curve_token, concept, n_terms, self)
+            worker.curve_ready.connect(self.on_curve_ready)
+            worker.finished.connect(lambda: self._curve_workers.remove(worker))
+            worker.finished.connect(worker.deleteLater)
+            self._curve_workers.append(worker)
+            worker.start()
         else:
             status_bar = self.statusBar()
             if status_bar:
                 status_bar.showMessage("Error: Could not load selected concept")
     
+    def on_curve_ready(self, token: int, concept: Dict[str, Any], data):
+        """Show a generated curve unless a newer concept/terms request superseded it"""
+        if token != self._curve_token:
+            return
+        self.canvas.apply_curve_data(concept, *data)
+        
+        # Update status bar
+        concept_name = concept.get('name', 'Unknown')
+        equation = concept.get('equation', 'No equation')
+        status_bar = self.statusBar()
+        if status_bar:
+            status_bar.showMessage(f"Loaded: {concept_name} | {equation}")
+    
+    def closeEvent(self, event):
+        # Running QThreads must not be destroyed along with the window
+        for worker in list(self._curve_workers):
+            worker.wait()
+        super().closeEvent(event)
+    
     def on_terms_changed(self):
         """Handle change in number of terms"""
-        self.on_concept_changed()  # Reload with new number of terms
+        self._terms_timer.start()  # Reload with new number of terms once changes settle
     
     def on_theme_changed(self):
         """Handle theme change"""
         theme = self.theme_dropdown.currentText().lower()
         self.canvas.apply_theme(theme)
-        self.canvas.draw()
+        self.canvas.redraw_background()
     
     def toggle_animation(self):
         """Toggle animation play/pause"""
@@ -508,9 +670,15 @@ class MainWindow(QMainWindow):
             
             filename = os.path.join(assets_dir, f"{concept_name}_visualization.png")
             
-            # Save the figure
-            self.canvas.fig.savefig(filename, dpi=300, bbox_inches='tight', 
-                                  facecolor=self.canvas.fig.get_facecolor())
+            # Save the figure; measuring a tight bounding box costs an extra render,
+            # so only high-resolution exports crop to it
+            if self.high_res_checkbox.isChecked():
+                dpi, bbox_inches = 300, 'tight'
+            else:
+                dpi, bbox_inches = 150, None
+            
+            self.canvas.fig.savefig(filename, dpi=dpi, bbox_inches=bbox_inches,
+                                    facecolor=self.canvas.fig.get_facecolor())
             
             status_bar = self.statusBar()
             if status_bar:
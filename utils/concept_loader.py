@@ -3,7 +3,21 @@ Utility functions for loading and parsing mathematical concepts from JSON
 """
 import json
 import os
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from typing import Dict, List, Tuple, Any, Optional
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# orjson's errors subclass json.JSONDecodeError, so both parsers fail the same way
+_json_loads = orjson.loads if HAS_ORJSON else json.loads
+
+# Default concepts file in the project root, resolved once at import
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_DEFAULT_CONCEPTS_PATH = os.path.join(_PROJECT_ROOT, 'visualization_concepts.json')
 
 def load_visualization_concepts(json_path: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
     """
@@ -14,15 +28,20 @@ def load_visualization_concepts(json_path: Optional[str] = None) -> Dict[str, Li
     
     Returns:
         Dictionary containing all mathematical concepts organized by category
+        (parsed once per path and shared between callers, so treat it as read-only)
     """
     if json_path is None:
         # Default to the JSON file in the project root
-        current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        json_path = os.path.join(current_dir, 'visualization_concepts.json')
-    
+        json_path = _DEFAULT_CONCEPTS_PATH
+    return _load_concepts_file(json_path)
+
+@lru_cache(maxsize=None)
+def _load_concepts_file(json_path: str) -> Dict[str, List[Dict[str, Any]]]:
+    """Parse a concepts file; the file does not change while the app runs"""
     try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        # Both parsers take the raw UTF-8 bytes
+        with open(json_path, 'rb') as f:
+            return _json_loads(f.read())
     except FileNotFoundError:
         print(f"Warning: Could not find {json_path}")
         return {}
@@ -37,6 +56,12 @@ def get_all_concepts_flat() -> List[Dict[str, Any]]:
     Returns:
         List of all concepts with added 'category' field
     """
+    # Shallow copies, so callers cannot alter the cached concepts
+    return [dict(concept) for concept in _flat_concepts()]
+
+@lru_cache(maxsize=1)
+def _flat_concepts() -> Tuple[Dict[str, Any], ...]:
+    """All concepts with their category, built once from the cached JSON"""
     concepts_data = load_visualization_concepts()
     flat_concepts = []
     
@@ -46,7 +71,15 @@ def get_all_concepts_flat() -> List[Dict[str, Any]]:
             concept_with_category['category'] = category
             flat_concepts.append(concept_with_category)
     
-    return flat_concepts
+    return tuple(flat_concepts)
+
+@lru_cache(maxsize=1)
+def _concepts_by_name() -> Dict[str, Dict[str, Any]]:
+    """Name -> concept index over all categories (the first concept wins on duplicates)"""
+    by_name = {}
+    for concept in _flat_concepts():
+        by_name.setdefault(concept['name'], concept)
+    return by_name
 
 def get_concepts_by_category(category: str) -> List[Dict[str, Any]]:
     """
@@ -59,7 +92,7 @@ def get_concepts_by_category(category: str) -> List[Dict[str, Any]]:
         List of concepts in that category
     """
     concepts_data = load_visualization_concepts()
-    return concepts_data.get(category, [])
+    return [dict(concept) for concept in concepts_data.get(category, [])]
 
 def get_concept_by_name(concept_name: str) -> Dict[str, Any]:
     """
@@ -71,11 +104,8 @@ def get_concept_by_name(concept_name: str) -> Dict[str, Any]:
     Returns:
         The concept dictionary if found, empty dict otherwise
     """
-    all_concepts = get_all_concepts_flat()
-    for concept in all_concepts:
-        if concept['name'] == concept_name:
-            return concept
-    return {}
+    concept = _concepts_by_name().get(concept_name)
+    return dict(concept) if concept is not None else {}
 
 def get_dropdown_options() -> List[str]:
     """
@@ -84,15 +114,23 @@ def get_dropdown_options() -> List[str]:
     Returns:
         List of strings formatted as "Category - Concept Name"
     """
-    all_concepts = get_all_concepts_flat()
-    options = []
-    
-    for concept in all_concepts:
-        category_display = concept['category'].replace('Series', ' Series').replace('Curves', ' Curves')
-        option = f"{category_display} - {concept['name']}"
-        options.append(option)
-    
-    return sorted(options)
+    return list(_dropdown_options())
+
+def _dropdown_label(concept: Dict[str, Any]) -> str:
+    """Dropdown label of a concept ("Category - Concept Name")"""
+    category_display = concept['category'].replace('Series', ' Series').replace('Curves', ' Curves')
+    return f"{category_display} - {concept['name']}"
+
+@lru_cache(maxsize=1)
+def _dropdown_options() -> Tuple[str, ...]:
+    """Sorted dropdown labels, built once from the cached concepts"""
+    return tuple(sorted(_dropdown_label(concept) for concept in _flat_concepts()))
+
+@lru_cache(maxsize=1)
+def _concepts_by_label() -> Dict[str, Dict[str, Any]]:
+    """Dropdown label -> concept, resolved by name exactly as parsing the label would"""
+    by_name = _concepts_by_name()
+    return {_dropdown_label(concept): by_name[concept['name']] for concept in _flat_concepts()}
 
 def parse_dropdown_selection(selection: str) -> Dict[str, Any]:
     """
@@ -104,6 +142,11 @@ def parse_dropdown_selection(selection: str) -> Dict[str, Any]:
     Returns:
         The concept dictionary
     """
+    # Labels produced by get_dropdown_options resolve with a single lookup
+    concept = _concepts_by_label().get(selection)
+    if concept is not None:
+        return dict(concept)
+    
     if " - " not in selection:
         return {}
     
@@ -0,0 +1,87 @@
+"""
+Batch evaluation kernels for epicycle chains.
+
+The chain kernel is JIT-compiled with Numba when it is installed; otherwise
+an equivalent NumPy implementation is used.
+"""
+
+import math
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+def _compute_chain_numpy(radii: np.ndarray, frequencies: np.ndarray, phases: np.ndarray,
+                         ts: np.ndarray, out: np.ndarray) -> None:
+    """NumPy version of the chain kernel (same contract as the Numba one)"""
+    angles = np.multiply.outer(ts, frequencies) + phases
+    out[:, 0, :] = 0.0
+    np.cumsum(radii * np.cos(angles), axis=1, out=out[:, 1:, 0])
+    np.cumsum(radii * np.sin(angles), axis=1, out=out[:, 1:, 1])
+
+
+if HAS_NUMBA:
+    @njit('void(f8[::1], f8[::1], f8[::1], f8[::1], f8[:, :, ::1])', cache=True, fastmath=True)
+    def _compute_chain_numba(radii, frequencies, phases, ts, out):
+        """Fill out[k, i] with the center of epicycle i (origin first) at time ts[k]"""
+        for k in range(ts.size):
+            x = 0.0
+            y = 0.0
+            out[k, 0, 0] = 0.0
+            out[k, 0, 1] = 0.0
+            for i in range(radii.size):
+                angle = frequencies[i] * ts[k] + phases[i]
+                x += radii[i] * math.cos(angle)
+                y += radii[i] * math.sin(angle)
+                out[k, i + 1, 0] = x
+                out[k, i + 1, 1] = y
+
+    _compute_chain = _compute_chain_numba
+else:
+    _compute_chain = _compute_chain_numpy
+
+
+def compute_chain(radii: np.ndarray, frequencies: np.ndarray, phases: np.ndarray,
+                  ts) -> np.ndarray:
+    """
+    Evaluate the epicycle chain at many times in one call.
+
+    Args:
+        radii: Epicycle radii
+        frequencies: Signed angular frequencies (direction folded in)
+        phases: Phase offsets
+        ts: Time values (scalar or 1-D array)
+
+    Returns:
+        (n_times, n_epicycles + 1, 2) array of chain positions, origin first
+    """
+    # The compiled signatures take writeable arrays; cached inputs may be read-only
+    radii = np.require(radii, np.float64, ['C', 'W'])
+    frequencies = np.require(frequencies, np.float64, ['C', 'W'])
+    phases = np.require(phases, np.float64, ['C', 'W'])
+    ts = np.require(np.atleast_1d(ts), np.float64, ['C', 'W'])
+
+    out = np.empty((ts.size, radii.size + 1, 2))
+    _compute_chain(radii, frequencies, phases, ts, out)
+    return out
+
+
+def sine_sum(radii: np.ndarray, frequencies: np.ndarray, phases: np.ndarray,
+             ts: np.ndarray) -> np.ndarray:
+    """
+    Evaluate a sum of sines (the y trace of an epicycle chain) at many times.
+    
+    Args:
+        radii: Term amplitudes
+        frequencies: Signed angular frequencies
+        phases: Phase offsets
+        ts: Time values (1-D array)
+    
+    Returns:
+        (n_times,) array of sum(radii * sin(frequencies * t + phases))
+    """
+    return np.sin(np.multiply.outer(ts, frequencies) + phases) @ radii
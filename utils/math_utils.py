@@ -6,9 +6,12 @@ import numpy as np
 from typing import List, Tuple, Callable
 import cmath
 import math
+from functools import lru_cache
 
+from .epicycle_kernels import sine_sum
 
-def calculate_fourier_coefficients(func: Callable, n_terms: int, period: float = 2*np.pi) -> List[complex]:
+
+def calculate_fourier_coefficients(func: Callable, n_terms: int, period: float = 2*np.pi) -> np.ndarray:
     """
     Calculate Fourier series coefficients for a given function.
     
@@ -18,46 +21,51 @@ def calculate_fourier_coefficients(func: Callable, n_terms: int, period: float =
         period: Period of the function
         
     Returns:
-        List of complex coefficients
+        complex128 array of coefficients, from harmonic -n_terms//2 up to n_terms//2
     """
-    coefficients = []
     N = 1000  # Number of sample points
     
     # Sample the function over one period
     t = np.linspace(0, period, N, endpoint=False)
     f_values = func(t)
     
-    # Calculate coefficients using discrete Fourier transform approach
-    for n in range(-n_terms//2, n_terms//2 + 1):
-        if n == 0:
-            # DC component
-            coeff = np.mean(f_values)
-        else:
-            # AC components
-            exp_term = np.exp(-1j * 2 * np.pi * n * t / period)
-            coeff = np.mean(f_values * exp_term)
-        
-        coefficients.append(coeff)
-    
-    return coefficients
+    # The samples are evenly spaced over one period, so one FFT yields every harmonic;
+    # negative harmonics wrap around to the end of the spectrum
+    spectrum = np.fft.fft(f_values) / N
+    harmonics = np.arange(-n_terms//2, n_terms//2 + 1)
+    return spectrum[harmonics % N]
 
 
 def square_wave(t: np.ndarray, amplitude: float = 1.0) -> np.ndarray:
-    """Generate square wave function."""
+    """Generate square wave function (float32 t gives a float32 result)."""
     return amplitude * np.sign(np.sin(t))
 
 
 def triangle_wave(t: np.ndarray, amplitude: float = 1.0) -> np.ndarray:
-    """Generate triangle wave function."""
+    """Generate triangle wave function (float32 t gives a float32 result)."""
     return amplitude * (2/np.pi) * np.arcsin(np.sin(t))
 
 
 def sawtooth_wave(t: np.ndarray, amplitude: float = 1.0) -> np.ndarray:
-    """Generate sawtooth wave function."""
-    return amplitude * (t % (2*np.pi)) / np.pi - amplitude
+    """Generate sawtooth wave function (float32 t gives a float32 result)."""
+    # Wrap t into one period with floor rather than the much slower floating-point modulo
+    wrapped = t - 2*np.pi * np.floor(t * (1 / (2*np.pi)))
+    return amplitude * (wrapped * (1 / np.pi) - 1)
+
 
+# Table of 1/n! shared by the Taylor helpers, grown on demand by _inv_factorial
+_INV_FACTORIALS = [1.0 / math.factorial(n) for n in range(64)]
 
-def taylor_sin_coefficients(n_terms: int) -> List[float]:
+
+def _inv_factorial(n: int) -> float:
+    """Look up 1/n!, extending the table with 1/n! = (1/(n-1)!) / n as needed."""
+    while len(_INV_FACTORIALS) <= n:
+        _INV_FACTORIALS.append(_INV_FACTORIALS[-1] / len(_INV_FACTORIALS))
+    return _INV_FACTORIALS[n]
+
+
+@lru_cache(maxsize=128)
+def taylor_sin_coefficients(n_terms: int) -> Tuple[float, ...]:
     """
     Calculate Taylor series coefficients for sin(x) around x=0.
     
@@ -65,40 +73,38 @@ def taylor_sin_coefficients(n_terms: int) -> List[float]:
         n_terms: Number of terms
         
     Returns:
-        List of coefficients
+        Tuple of coefficients (cached, so immutable)
     """
-    coefficients = []
-    for n in range(n_terms):
-        if n % 2 == 1:  # Odd terms only for sin(x)
-            coeff = (-1)**((n-1)//2) / math.factorial(n)
-            coefficients.append(coeff)
-        else:
-            coefficients.append(0.0)
+    coefficients = [0.0] * n_terms
+    sign = 1.0
+    for n in range(1, n_terms, 2):  # Odd terms only for sin(x), alternating in sign
+        coefficients[n] = sign * _inv_factorial(n)
+        sign = -sign
     
-    return coefficients
+    return tuple(coefficients)
 
 
-def taylor_cos_coefficients(n_terms: int) -> List[float]:
+@lru_cache(maxsize=128)
+def taylor_cos_coefficients(n_terms: int) -> Tuple[float, ...]:
     """
     Calculate Taylor series coefficients for cos(x) around x=0.
     
     Args:
         n_terms: Number of terms
           Returns:
-        List of coefficients
+        Tuple of coefficients (cached, so immutable)
     """
-    coefficients = []
-    for n in range(n_terms):
-        if n % 2 == 0:  # Even terms only for cos(x)
-            coeff = (-1)**(n//2) / math.factorial(n)
-            coefficients.append(coeff)
-        else:
-            coefficients.append(0.0)
+    coefficients = [0.0] * n_terms
+    sign = 1.0
+    for n in range(0, n_terms, 2):  # Even terms only for cos(x), alternating in sign
+        coefficients[n] = sign * _inv_factorial(n)
+        sign = -sign
     
-    return coefficients
+    return tuple(coefficients)
 
 
-def taylor_exp_coefficients(n_terms: int) -> List[float]:
+@lru_cache(maxsize=128)
+def taylor_exp_coefficients(n_terms: int) -> Tuple[float, ...]:
     """
     Calculate Taylor series coefficients for e^x around x=0.
     
@@ -106,9 +112,20 @@ def taylor_exp_coefficients(n_terms: int) -> List[float]:
         n_terms: Number of terms
         
     Returns:
-        List of coefficients
+        Tuple of coefficients (cached, so immutable)
     """
-    return [1.0 / math.factorial(n) for n in range(n_terms)]
+    return tuple(_inv_factorial(n) for n in range(n_terms))
+
+
+# (freq_x, freq_y, phase_shift) of each named Lissajous curve
+_LISSAJOUS_CURVES = {
+    'circle': (1, 1, math.pi/2),
+    'ellipse': (1, 1, math.pi/4),
+    'eight': (1, 2, 0),
+    'three_leaf': (2, 3, 0),
+    'four_leaf': (3, 4, math.pi/4),
+    'complex': (3, 5, math.pi/6)
+}
 
 
 def lissajous_params(curve_type: str) -> Tuple[float, float, float]:
@@ -121,16 +138,7 @@ def lissajous_params(curve_type: str) -> Tuple[float, float, float]:
     Returns:
         Tuple of (freq_x, freq_y, phase_shift)
     """
-    curves = {
-        'circle': (1, 1, np.pi/2),
-        'ellipse': (1, 1, np.pi/4),
-        'eight': (1, 2, 0),
-        'three_leaf': (2, 3, 0),
-        'four_leaf': (3, 4, np.pi/4),
-        'complex': (3, 5, np.pi/6)
-    }
-    
-    return curves.get(curve_type, (1, 1, np.pi/2))
+    return _LISSAJOUS_CURVES.get(curve_type, _LISSAJOUS_CURVES['circle'])
 
 
 def normalize_angle(angle: float) -> float:
@@ -160,7 +168,8 @@ def rotate_point(point: Tuple[float, float], angle: float, center: Tuple[float,
     Returns:
         Rotated point coordinates
     """
-    cos_a, sin_a = np.cos(angle), np.sin(angle)
+    rotation = cmath.exp(1j * angle)
+    cos_a, sin_a = rotation.real, rotation.imag
     x, y = point[0] - center[0], point[1] - center[1]
     
     new_x = x * cos_a - y * sin_a + center[0]
@@ -169,90 +178,178 @@ def rotate_point(point: Tuple[float, float], angle: float, center: Tuple[float,
     return new_x, new_y
 
 
+def rotate_points(points: np.ndarray, angle: float, center: Tuple[float, float] = (0, 0)) -> np.ndarray:
+    """
+    Rotate many points around a center by a given angle in one matrix product.
+    
+    Args:
+        points: (N, 2) array of points to rotate
+        angle: Rotation angle in radians
+        center: Center of rotation (x, y)
+        
+    Returns:
+        (N, 2) array of rotated points
+    """
+    rotation = cmath.exp(1j * angle)
+    cos_a, sin_a = rotation.real, rotation.imag
+    center = np.asarray(center, dtype=np.float64)
+    
+    # Row vectors, so apply the transpose of the rotation matrix on the right
+    return (np.asarray(points, dtype=np.float64) - center) @ np.array([[cos_a, sin_a],
+                                                                      [-sin_a, cos_a]]) + center
+
+
 # Additional functions for JSON concept integration
-from typing import Dict, Any
+from typing import Dict, Any, Union
+
+# Packed epicycle record; each field of an array of these is indexed like the old dict keys
+EPICYCLE_DTYPE = np.dtype([('radius', 'f8'), ('frequency', 'f8'), ('phase', 'f8'), ('direction', 'f8')])
+
+def _epicycle_records(epicycles: List[Tuple[float, float, float, float]]) -> np.ndarray:
+    """Pack (radius, frequency, phase, direction) tuples into an EPICYCLE_DTYPE array"""
+    return np.array(epicycles, dtype=EPICYCLE_DTYPE)
+
+def epicycle_arrays(epicycles: Union[np.ndarray, List[Dict[str, float]]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Pack epicycle records into structure-of-arrays form.
+    
+    Args:
+        epicycles: EPICYCLE_DTYPE array or list of epicycle dictionaries
+        
+    Returns:
+        Tuple of (radii, frequencies, phases) float64 arrays, with each
+        epicycle's direction folded into the sign of its frequency
+    """
+    if isinstance(epicycles, np.ndarray):
+        return (np.array(epicycles['radius']), epicycles['direction'] * epicycles['frequency'],
+                np.array(epicycles['phase']))
+    
+    n = len(epicycles)
+    radii = np.fromiter((ep['radius'] for ep in epicycles), dtype=np.float64, count=n)
+    frequencies = np.fromiter((ep['direction'] * ep['frequency'] for ep in epicycles),
+                              dtype=np.float64, count=n)
+    phases = np.fromiter((ep['phase'] for ep in epicycles), dtype=np.float64, count=n)
+    return radii, frequencies, phases
+
+def sine_series_arrays(samples: np.ndarray, n_terms: int,
+                       rel_tol: float = 1e-9) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Decompose one period of a function into its strongest sine-series terms.
+    
+    Each term is radius * sin(frequency * t + phase), i.e. the y component of
+    an epicycle arm.
+    
+    Args:
+        samples: Function values at t = 2*pi*k/N for k = 0..N-1
+        n_terms: Maximum number of terms to keep
+        rel_tol: Terms smaller than this fraction of the largest are dropped
+        
+    Returns:
+        Tuple of (radii, frequencies, phases) float64 arrays, in frequency order
+    """
+    spectrum = np.fft.rfft(samples) / len(samples)
+    cos_coeffs = 2 * spectrum.real
+    sin_coeffs = -2 * spectrum.imag
+    cos_coeffs[0] /= 2  # The constant term is not doubled
+    if len(samples) % 2 == 0:
+        cos_coeffs[-1] /= 2  # Neither is the Nyquist term
+    
+    # a*cos(kt) + b*sin(kt) = r*sin(kt + p)
+    radii = np.hypot(cos_coeffs, sin_coeffs)
+    phases = np.arctan2(cos_coeffs, sin_coeffs)
+    
+    keep = np.argsort(radii)[::-1][:n_terms]
+    keep = np.sort(keep[radii[keep] > rel_tol * radii.max()])
+    return radii[keep], keep.astype(np.float64), phases[keep]
+
+@lru_cache(maxsize=128)
+def _fourier_epicycles(concept_name: str, n_terms: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Fourier epicycles of a concept as read-only (radii, frequencies, phases, directions) arrays"""
+    if "Square" in concept_name:
+        # Square wave Fourier series: f(x) = (4/π) * Σ (1/n) * sin(n*x), n = 1,3,5,...
+        n = np.arange(1, n_terms + 1, 2, dtype=np.float64)  # Only odd harmonics
+        amplitudes = 4 / (np.pi * n)
+    
+    elif "Sawtooth" in concept_name:
+        # Sawtooth wave: f(x) = (2/π) * Σ (-1)^(n+1)/n * sin(n*x)
+        n = np.arange(1, n_terms + 1, dtype=np.float64)
+        amplitudes = 2 / (np.pi * n) * np.where(n % 2 == 1, 1.0, -1.0)
+    
+    elif "Triangle" in concept_name:
+        # Triangle wave: f(x) = (8/π²) * Σ (-1)^((n-1)/2)/n² * sin(n*x), n odd
+        n = np.arange(1, n_terms + 1, 2, dtype=np.float64)  # Only odd harmonics
+        amplitudes = 8 / (np.pi**2 * n**2) * np.where(n % 4 == 1, 1.0, -1.0)
+    
+    else:
+        n = amplitudes = np.empty(0)
+    
+    # Negative terms become positive radii half a turn out of phase
+    epicycles = (np.abs(amplitudes), n, np.where(amplitudes > 0, 0.0, np.pi), np.ones_like(n))
+    for array in epicycles:
+        array.setflags(write=False)
+    return epicycles
+
+@lru_cache(maxsize=8)
+def _twiddles(n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Read-only cos and sin of the n angles 2πm/n, m = 0..n-1"""
+    angles = 2 * np.pi / n * np.arange(n)
+    table = (np.cos(angles), np.sin(angles))
+    for array in table:
+        array.setflags(write=False)
+    return table
+
+@lru_cache(maxsize=8)
+def _t_grid(t_points: int) -> np.ndarray:
+    """Read-only time grid over [0, 2π] shared by every curve with this many points"""
+    t = np.linspace(0, 2 * np.pi, t_points)
+    t.setflags(write=False)
+    return t
 
 class ConceptMath:
     """Mathematical calculations specifically for JSON concept integration"""
     
     @staticmethod
-    def generate_fourier_epicycles(concept_name: str, n_terms: int = 10) -> List[Dict[str, float]]:
-        """Generate epicycles for Fourier series concepts"""
-        epicycles = []
-        
-        if "Square" in concept_name:
-            # Square wave Fourier series: f(x) = (4/π) * Σ (1/n) * sin(n*x), n = 1,3,5,...
-            for n in range(1, n_terms + 1, 2):  # Only odd harmonics
-                amplitude = 4 / (np.pi * n)
-                epicycles.append({
-                    'radius': amplitude,
-                    'frequency': n,
-                    'phase': 0,
-                    'direction': 1
-                })
-        
-        elif "Sawtooth" in concept_name:
-            # Sawtooth wave: f(x) = (2/π) * Σ (-1)^(n+1)/n * sin(n*x)
-            for n in range(1, n_terms + 1):
-                amplitude = 2 / (np.pi * n) * ((-1) ** (n + 1))
-                epicycles.append({
-                    'radius': abs(amplitude),
-                    'frequency': n,
-                    'phase': 0 if amplitude > 0 else np.pi,
-                    'direction': 1
-                })
-        
-        elif "Triangle" in concept_name:
-            # Triangle wave: f(x) = (8/π²) * Σ (-1)^((n-1)/2)/n² * sin(n*x), n odd
-            for n in range(1, n_terms + 1, 2):  # Only odd harmonics
-                amplitude = 8 / (np.pi**2 * n**2) * ((-1) ** ((n - 1) // 2))
-                epicycles.append({
-                    'radius': abs(amplitude),
-                    'frequency': n,
-                    'phase': 0 if amplitude > 0 else np.pi,
-                    'direction': 1
-                })
-        
+    def generate_fourier_epicycles(concept_name: str, n_terms: int = 10) -> np.ndarray:
+        """Generate epicycles for Fourier series concepts as an EPICYCLE_DTYPE array"""
+        radii, frequencies, phases, directions = _fourier_epicycles(concept_name, n_terms)
+        epicycles = np.empty(len(radii), dtype=EPICYCLE_DTYPE)
+        epicycles['radius'] = radii
+        epicycles['frequency'] = frequencies
+        epicycles['phase'] = phases
+        epicycles['direction'] = directions
         return epicycles
     
     @staticmethod
-    def calculate_epicycle_position(epicycles: List[Dict[str, float]], t: float) -> Tuple[float, float]:
+    def calculate_epicycle_position(epicycles: Union[np.ndarray, List[Dict[str, float]]], t: float) -> Tuple[float, float]:
         """Calculate current position of epicycle system"""
-        x, y = 0, 0
-        
-        for epicycle in epicycles:
-            radius = epicycle['radius']
-            freq = epicycle['frequency']
-            phase = epicycle['phase']
-            direction = epicycle['direction']
-            
-            angle = direction * freq * t + phase
-            x += radius * np.cos(angle)
-            y += radius * np.sin(angle)
-        
-        return x, y
+        radii, frequencies, phases = epicycle_arrays(epicycles)
+        position = radii @ np.exp(1j * (frequencies * t + phases))
+        return float(position.real), float(position.imag)
     
     @staticmethod
-    def get_epicycle_chain_positions(epicycles: List[Dict[str, float]], t: float) -> List[Tuple[float, float]]:
-        """Get positions of all epicycles in chain for visualization"""
-        positions = [(0.0, 0.0)]  # Start at origin
-        x, y = 0, 0
-        
-        for epicycle in epicycles:
-            radius = epicycle['radius']
-            freq = epicycle['frequency']
-            phase = epicycle['phase']
-            direction = epicycle['direction']
-            
-            angle = direction * freq * t + phase
-            x += radius * np.cos(angle)
-            y += radius * np.sin(angle)
-            positions.append((float(x), float(y)))
-        
+    def epicycle_offsets(radii: np.ndarray, frequencies: np.ndarray, phases: np.ndarray, 
+                         t: float) -> np.ndarray:
+        """Get the (dx, dy) arm of every epicycle at time t as an (n, 2) array"""
+        # complex128 stores (real, imag) pairs contiguously, which is exactly the (n, 2) layout
+        arms = radii * np.exp(1j * (frequencies * t + phases))
+        return arms.view(np.float64).reshape(-1, 2)
+    
+    @staticmethod
+    def chain_positions(offsets: np.ndarray) -> np.ndarray:
+        """Accumulate epicycle arms into the (n + 1, 2) chain of centers, starting at the origin"""
+        positions = np.empty((len(offsets) + 1, 2))
+        positions[0] = 0.0
+        np.cumsum(offsets, axis=0, out=positions[1:])
         return positions
+    
+    @staticmethod
+    def get_epicycle_chain_positions(epicycles: Union[np.ndarray, List[Dict[str, float]]], t: float) -> List[Tuple[float, float]]:
+        """Get positions of all epicycles in chain for visualization"""
+        offsets = ConceptMath.epicycle_offsets(*epicycle_arrays(epicycles), t)
+        return [tuple(position) for position in ConceptMath.chain_positions(offsets).tolist()]
 
 def generate_curve_from_concept(concept: Dict[str, Any], n_terms: int = 10, 
-                               t_points: int = 1000) -> Tuple[np.ndarray, np.ndarray, List[Dict[str, float]]]:
+                               t_points: int = 1000) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
     Generate curve data and epicycles from a JSON concept
     
@@ -262,26 +359,36 @@ def generate_curve_from_concept(concept: Dict[str, Any], n_terms: int = 10,
         t_points: Number of time points for curve
     
     Returns:
-        Tuple of (x_curve, y_curve, epicycles)
+        Tuple of (x_curve, y_curve, epicycles), with the epicycles as an EPICYCLE_DTYPE array
     """
     concept_name = concept.get('name', '')
     category = concept.get('category', '')
     
-    # Time parameter
-    t = np.linspace(0, 2 * np.pi, t_points)
+    # Time parameter (cached and read-only, so also safe to return as x_curve)
+    t = _t_grid(t_points)
     
     if category == 'FourierSeries':
         epicycles = ConceptMath.generate_fourier_epicycles(concept_name, n_terms)
         
-        # Generate the curve from epicycles
-        x_curve = []
-        y_curve = []
-        for time in t:
-            x, y = ConceptMath.calculate_epicycle_position(epicycles, time)
-            x_curve.append(time)  # x-axis is time
-            y_curve.append(y)     # y-axis is the function value
+        # Generate the curve from epicycles, evaluating every time sample at once
+        radii, frequencies, phases, directions = _fourier_epicycles(concept_name, n_terms)
+        frequencies = directions * frequencies
+        x_curve = t   # x-axis is time
+        
+        # y-axis is the function value
+        if t_points > 1 and np.all(frequencies == np.round(frequencies)):
+            # t[j] = 2πj/M with M = t_points - 1, so every integer-frequency angle is one
+            # of M table angles: sin(k*t[j] + p) = sin(θ)cos(p) + cos(θ)sin(p), θ = 2π((k*j) % M)/M
+            M = t_points - 1
+            table_index = np.multiply.outer(np.arange(t_points), frequencies.astype(np.int64))
+            table_index %= M
+            cos_table, sin_table = _twiddles(M)
+            y_curve = (sin_table.take(table_index) @ (radii * np.cos(phases)) +
+                       cos_table.take(table_index) @ (radii * np.sin(phases)))
+        else:
+            y_curve = sine_sum(radii, frequencies, phases, t)
         
-        return np.array(x_curve), np.array(y_curve), epicycles
+        return x_curve, y_curve, epicycles
     
     elif category == 'ParametricCurves':
         if 'Lissajous' in concept_name:
@@ -290,33 +397,35 @@ def generate_curve_from_concept(concept: Dict[str, Any], n_terms: int = 10,
             delta = np.pi/2
             A, B = 1, 1  # amplitudes
             
-            x_curve = A * np.sin(a * t + delta)
-            y_curve = B * np.sin(b * t)
+            # sin(k*t + δ) is the imaginary part of (e^(it))^k * e^(iδ), so both coordinates
+            # come from one complex exponential and integer powers of it
+            z = np.exp(1j * t)
+            x_curve = A * (z**a * cmath.exp(1j * delta)).imag
+            y_curve = B * (z**b).imag
             
             # Create simple epicycles for visualization
-            epicycles = [
-                {'radius': A, 'frequency': a, 'phase': delta, 'direction': 1},
-                {'radius': B, 'frequency': b, 'phase': 0, 'direction': 1}
-            ]
+            epicycles = _epicycle_records([(A, a, delta, 1), (B, b, 0, 1)])
         
         elif 'Epicycloid' in concept_name:
             # Epicycloid: x(t) = (R + r)*cos(t) - r*cos((R + r)/r * t)
             R, r = 3, 1  # radii
             ratio = (R + r) / r
             
-            x_curve = (R + r) * np.cos(t) - r * np.cos(ratio * t)
-            y_curve = (R + r) * np.sin(t) - r * np.sin(ratio * t)
+            # Evaluate x + iy = (R + r)*e^(it) - r*e^(i*ratio*t); an integer ratio only needs
+            # a power of e^(it) rather than a second exponential
+            z = np.exp(1j * t)
+            z_ratio = z**int(ratio) if float(ratio).is_integer() else np.exp(1j * ratio * t)
+            curve = (R + r) * z - r * z_ratio
+            x_curve = np.ascontiguousarray(curve.real)
+            y_curve = np.ascontiguousarray(curve.imag)
             
-            epicycles = [
-                {'radius': R + r, 'frequency': 1, 'phase': 0, 'direction': 1},
-                {'radius': r, 'frequency': ratio, 'phase': np.pi, 'direction': 1}
-            ]
+            epicycles = _epicycle_records([(R + r, 1, 0, 1), (r, ratio, np.pi, 1)])
         
         else:
             # Default to simple circle
             x_curve = np.cos(t)
             y_curve = np.sin(t)
-            epicycles = [{'radius': 1, 'frequency': 1, 'phase': 0, 'direction': 1}]
+            epicycles = _epicycle_records([(1, 1, 0, 1)])
         
         return x_curve, y_curve, epicycles
     
@@ -329,13 +438,9 @@ def generate_curve_from_concept(concept: Dict[str, Any], n_terms: int = 10,
             # Create epicycles representing Taylor terms
             epicycles = []
             for n in range(min(n_terms, 8)):  # Limit for performance
-                coeff = 1 / math.factorial(n)
-                epicycles.append({
-                    'radius': coeff * 0.5,  # Scale for visualization
-                    'frequency': n + 1,
-                    'phase': 0,
-                    'direction': 1
-                })
+                coeff = _inv_factorial(n)
+                epicycles.append((coeff * 0.5, n + 1, 0, 1))  # Radius scaled for visualization
+            epicycles = _epicycle_records(epicycles)
         
         elif 'Sine' in concept_name:
             x_curve = t
@@ -346,19 +451,15 @@ def generate_curve_from_concept(concept: Dict[str, Any], n_terms: int = 10,
             for n in range(min(n_terms, 6)):
                 power = 2 * n + 1
                 sign = (-1) ** n
-                coeff = sign / math.factorial(power)
-                epicycles.append({
-                    'radius': abs(coeff) * 2,  # Scale for visualization
-                    'frequency': power,
-                    'phase': 0 if coeff > 0 else np.pi,
-                    'direction': 1
-                })
+                coeff = sign * _inv_factorial(power)
+                epicycles.append((abs(coeff) * 2, power, 0 if coeff > 0 else np.pi, 1))  # Radius scaled for visualization
+            epicycles = _epicycle_records(epicycles)
         
         else:
             # Default case
             x_curve = t
             y_curve = np.sin(t)
-            epicycles = [{'radius': 1, 'frequency': 1, 'phase': 0, 'direction': 1}]
+            epicycles = _epicycle_records([(1, 1, 0, 1)])
         
         return x_curve, y_curve, epicycles
     
@@ -366,6 +467,6 @@ def generate_curve_from_concept(concept: Dict[str, Any], n_terms: int = 10,
         # Default case - simple sine wave
         x_curve = t
         y_curve = np.sin(t)
-        epicycles = [{'radius': 1, 'frequency': 1, 'phase': 0, 'direction': 1}]
+        epicycles = _epicycle_records([(1, 1, 0, 1)])
         
         return x_curve, y_curve, epicycles